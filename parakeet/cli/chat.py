@@ -7,6 +7,7 @@ from ollama import Client
 
 from ..core.config import get_ollama_config
 from ..core.agent import run_agent_loop
+from ..core.pathway_analyzer import set_cache_enabled
 
 
 def chat(
@@ -14,8 +15,11 @@ def chat(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Model name to use"),
     new: bool = typer.Option(False, "--new", "-n", help="Start a new session (don't resume last)"),
     multi_agent: bool = typer.Option(False, "--multi-agent", help="Enable multi-agent mode with specialist agents"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk KEGG lookup cache"),
 ) -> None:
     """Start an interactive chat session with the AI agent."""
+    if no_cache:
+        set_cache_enabled(False)
     resolved_host, resolved_model = get_ollama_config(host, model, interactive=True)
     client = Client(host=resolved_host)
     run_agent_loop(client, resolved_model, new_session=new, multi_agent=multi_agent)
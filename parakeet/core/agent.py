@@ -1,13 +1,19 @@
 """Agent loop for Parakeet."""
 
-import json
 from typing import Any, Optional
 
 from ollama import Client
 
 from ..ui import console, print_tool, thinking_spinner
 from .config import load_project_context
-from .tools import TOOLS, TOOL_REGISTRY, DANGEROUS_TOOLS, CONDITIONAL_TOOLS
+from .tools import (
+    TOOLS,
+    TOOL_REGISTRY,
+    DANGEROUS_TOOLS,
+    CONDITIONAL_TOOLS,
+    encode_result,
+    validate_tool_args,
+)
 from .session import (
     create_session_id,
     save_session,
@@ -365,6 +371,12 @@ def run_agent_loop(client: Client, model: str, new_session: bool = False, multi_
                             "available_tools_sample": available_tools
                         }
                         console.print(f"[red]Error: Unknown tool '{tool_name}'[/]")
+                    elif arg_error := validate_tool_args(tool_name, tool_args):
+                        result = {
+                            "error": arg_error,
+                            "message": f"Invalid arguments for tool '{tool_name}'. Check the tool signature and try again."
+                        }
+                        console.print(f"[red]Error: {arg_error}[/]")
                     else:
                         # Determine if confirmation is needed
                         needs_confirmation = False
@@ -430,7 +442,7 @@ def run_agent_loop(client: Client, model: str, new_session: bool = False, multi_
                     # Add tool result to conversation
                     conversation.append({
                         "role": "tool",
-                        "content": json.dumps(result)
+                        "content": encode_result(result)
                     })
             else:
                 # No tool calls - add to conversation and break
@@ -8,6 +8,11 @@ from typing import Optional
 from dotenv import load_dotenv
 from ollama import Client
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 load_dotenv()
 
 CONFIG_DIR = Path.home() / ".parakeet"
@@ -16,36 +21,37 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 
 def load_config() -> dict[str, str]:
     """Load config from ~/.parakeet/config.json or return empty dict."""
-    if CONFIG_FILE.exists():
-        try:
-            return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    # A missing file surfaces as FileNotFoundError, saving a separate exists() stat
+    try:
+        raw = CONFIG_FILE.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, IOError):
+        return {}
 
 
 def load_project_context() -> Optional[str]:
     """Load project context from .parakeet/context.md if it exists."""
     context_file = Path.cwd() / ".parakeet" / "context.md"
-    if context_file.exists():
-        try:
-            return context_file.read_text(encoding="utf-8")
-        except IOError:
-            return None
-    return None
+    try:
+        return context_file.read_text(encoding="utf-8")
+    except IOError:
+        return None
 
 
 def save_config(config: dict[str, str]) -> None:
     """Save config to ~/.parakeet/config.json."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    if orjson is not None:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(config, indent=2) + "\n").encode("utf-8")
+    CONFIG_FILE.write_bytes(data)
 
 
 def list_available_models(client: Client) -> list[str]:
     """Get list of available models from Ollama."""
     try:
-        response = client.list()
-        return [model['name'] for model in response.get('models', [])]
+        return [model['name'] for model in client.list().get('models', ())]
     except Exception:
         return []
 
@@ -7,14 +7,34 @@ from typing import Optional
 
 from ..ui import console, print_error, print_success
 
+_UNSET = object()
+_detected_manager: object = _UNSET
+
+
+def reset_package_manager_cache() -> None:
+    """Forget the detected package manager so the next call probes PATH again."""
+    global _detected_manager
+    _detected_manager = _UNSET
+
 
 def detect_package_manager() -> Optional[str]:
     """
     Detect available package manager.
 
+    The result is cached for the life of the process; call
+    reset_package_manager_cache() after installing a package manager.
+
     Returns:
         'uv', 'conda', 'venv', or None if nothing found
     """
+    global _detected_manager
+    if _detected_manager is _UNSET:
+        _detected_manager = _probe_package_manager()
+    return _detected_manager
+
+
+def _probe_package_manager() -> Optional[str]:
+    """Search PATH for a package manager, in order of preference."""
     # Prefer uv (fastest, modern)
     if shutil.which("uv"):
         return "uv"
@@ -64,6 +84,7 @@ def install_uv() -> bool:
             timeout=120
         )
         if result.returncode == 0:
+            reset_package_manager_cache()
             print_success("uv installed successfully")
             console.print("[dim]You may need to restart your shell or run: source ~/.local/bin/env[/]")
             return True
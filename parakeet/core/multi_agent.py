@@ -13,7 +13,14 @@ from .agents import (
     BioinformaticsAgent,
 )
 from .agents.base import AgentTask, AgentResult
-from .tools import TOOL_REGISTRY, DANGEROUS_TOOLS, CONDITIONAL_TOOLS, propose_plan_tool
+from .tools import (
+    TOOL_REGISTRY,
+    DANGEROUS_TOOLS,
+    CONDITIONAL_TOOLS,
+    propose_plan_tool,
+    encode_result,
+    validate_tool_args,
+)
 from .agent import confirm_execution, stream_response
 
 
@@ -163,6 +170,12 @@ class MultiAgentCoordinator:
                             "available_tools_sample": available_tools
                         }
                         console.print(f"  [red][{agent_name}] Error: Unknown tool '{tool_name}'[/]")
+                    elif arg_error := validate_tool_args(tool_name, tool_args):
+                        result = {
+                            "error": arg_error,
+                            "message": f"Invalid arguments for tool '{tool_name}'. Check the tool signature and try again."
+                        }
+                        console.print(f"  [red][{agent_name}] Error: {arg_error}[/]")
                     else:
                         # Handle confirmations same as main agent
                         needs_confirmation = False
@@ -227,7 +240,7 @@ class MultiAgentCoordinator:
                     # Add tool result
                     conversation.append({
                         "role": "tool",
-                        "content": json.dumps(result)
+                        "content": encode_result(result)
                     })
             else:
                 # No tool calls - agent is done
@@ -317,7 +330,7 @@ class MultiAgentCoordinator:
                         # Add delegation result to orchestrator conversation
                         orchestrator_conversation.append({
                             "role": "tool",
-                            "content": json.dumps(result)
+                            "content": encode_result(result)
                         })
                 else:
                     # Orchestrator is done
@@ -1,16 +1,105 @@
 """Pathway analysis tools for metabolic engineering optimization."""
 
+import functools
+import hashlib
+import os
 import re
-from typing import Any, Optional
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
 from collections import defaultdict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..ui import console
 
 KEGG_API = "https://rest.kegg.jp"
 TIMEOUT = 30
 
+# Shared session so repeated KEGG calls reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+CACHE_DIR = Path.home() / ".parakeet" / "cache" / "kegg"
+CACHE_TTL = 86400  # seconds
+CACHE_MAX_ENTRIES = 512
+
+_cache_enabled = True
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the on-disk KEGG response cache."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def _kegg_get(url: str) -> str:
+    """
+    Fetch a KEGG REST URL and return the response text.
+
+    Successful responses are cached on disk under CACHE_DIR, keyed by URL,
+    for CACHE_TTL seconds; beyond CACHE_MAX_ENTRIES the least recently used
+    entries are evicted. Failed requests raise and are never cached, so
+    callers that fall back to empty results during an outage recover as
+    soon as KEGG is reachable again.
+    """
+    cache_file = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.txt"
+    if _cache_enabled:
+        try:
+            stat = cache_file.stat()
+            if stat.st_mtime + CACHE_TTL > time.time():
+                text = cache_file.read_text(encoding="utf-8")
+                # Record the hit in atime for LRU eviction; mtime keeps the TTL
+                try:
+                    os.utime(cache_file, (time.time(), stat.st_mtime))
+                except OSError:
+                    pass
+                return text
+        except OSError:
+            pass
+
+    response = _SESSION.get(url, timeout=TIMEOUT)
+    response.raise_for_status()
+    text = response.text
+
+    if _cache_enabled:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write beside the entry and rename it into place, so an
+            # interrupted write never leaves a truncated "fresh" entry
+            f = tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=CACHE_DIR, suffix=".tmp", delete=False
+            )
+            try:
+                with f:
+                    f.write(text)
+                os.replace(f.name, cache_file)
+            finally:
+                Path(f.name).unlink(missing_ok=True)
+            _prune_cache()
+        except OSError:
+            pass
+    return text
+
+
+def _prune_cache() -> None:
+    """Drop expired cache entries, then the least recently used beyond CACHE_MAX_ENTRIES."""
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        try:
+            entries.append((entry.stat(), entry.path))
+        except OSError:
+            continue
+    entries.sort(key=lambda item: item[0].st_atime, reverse=True)
+
+    cutoff = time.time() - CACHE_TTL
+    for index, (stat, path) in enumerate(entries):
+        if index >= CACHE_MAX_ENTRIES or stat.st_mtime < cutoff:
+            Path(path).unlink(missing_ok=True)
+
 
 def get_pathway_info(pathway_id: str) -> dict[str, Any]:
     """
@@ -24,11 +113,7 @@ def get_pathway_info(pathway_id: str) -> dict[str, Any]:
     """
     try:
         # Fetch pathway data
-        url = f"{KEGG_API}/get/{pathway_id}"
-        response = requests.get(url, timeout=TIMEOUT)
-        response.raise_for_status()
-
-        content = response.text
+        content = _kegg_get(f"{KEGG_API}/get/{pathway_id}")
         info = parse_kegg_flat_file(content)
 
         # Get pathway image/KGML for structure if needed
@@ -40,6 +125,17 @@ def get_pathway_info(pathway_id: str) -> dict[str, Any]:
         return {"error": str(e)}
 
 
+# One match per line: an optional section keyword at column 0, then the
+# stripped line content. Continuation lines have an empty keyword.
+_LINE_RE = re.compile(r"^(\S*)[^\S\n]*(.*?)[^\S\n]*$", re.M)
+
+_EC_RE = re.compile(r"[\d\-]+\.[\d\-]+\.[\d\-]+\.[\d\-]+")
+_REACTION_RE = re.compile(r"R\d{5}")
+_MODULE_RE = re.compile(r"M\d{5}")
+_COMPOUND_RE = re.compile(r"^(C\d{5})[^\S\n]+(.+)$", re.M)
+_GENE_RE = re.compile(r"^(\S+)[^\S\n]+(.+)$", re.M)
+
+
 def parse_kegg_flat_file(content: str) -> dict[str, Any]:
     """Parse KEGG flat file format into structured data."""
     result = {
@@ -56,67 +152,80 @@ def parse_kegg_flat_file(content: str) -> dict[str, Any]:
     current_section = None
     current_content = []
 
-    for line in content.split("\n"):
-        if not line:
-            continue
-
-        # Check for section headers (start at column 0)
-        if line[0] != " ":
-            # Save previous section
-            if current_section and current_content:
-                _process_section(result, current_section, current_content)
-
-            # Start new section
-            parts = line.split(None, 1)
-            current_section = parts[0] if parts else None
-            current_content = [parts[1]] if len(parts) > 1 else []
-        else:
-            # Continue current section
-            current_content.append(line.strip())
+    for match in _LINE_RE.finditer(content):
+        key, text = match.groups()
+        if key:
+            # Section header: flush the previous section and start a new one
+            if current_content:
+                _process_section(result, current_section, "\n".join(current_content))
+            current_section, current_content = key, []
+        if text:
+            current_content.append(text)
 
     # Process last section
-    if current_section and current_content:
-        _process_section(result, current_section, current_content)
+    if current_content:
+        _process_section(result, current_section, "\n".join(current_content))
 
     return result
 
 
-def _process_section(result: dict, section: str, content: list[str]) -> None:
-    """Process a section from KEGG flat file."""
-    text = " ".join(content)
-
-    if section == "NAME":
-        result["name"] = text
-    elif section == "DESCRIPTION":
-        result["description"] = text
-    elif section == "ENZYME":
-        # Parse enzyme EC numbers
-        ec_numbers = re.findall(r"[\d\-]+\.[\d\-]+\.[\d\-]+\.[\d\-]+", text)
-        result["enzymes"] = ec_numbers
-    elif section == "REACTION":
-        # Parse reaction IDs
-        reactions = re.findall(r"R\d{5}", text)
-        result["reactions"] = reactions
-    elif section == "COMPOUND":
-        # Parse compound entries
-        compounds = []
-        for item in content:
-            match = re.match(r"(C\d{5})\s+(.+)", item)
-            if match:
-                compounds.append({"id": match.group(1), "name": match.group(2)})
-        result["compounds"] = compounds
-    elif section == "GENE":
-        # Parse gene entries
-        genes = []
-        for item in content:
-            # Format: gene_id  description (K number)
-            match = re.match(r"(\S+)\s+(.+)", item)
-            if match:
-                genes.append({"id": match.group(1), "description": match.group(2)})
-        result["genes"] = genes[:50]  # Limit
-    elif section == "MODULE":
-        modules = re.findall(r"M\d{5}", text)
-        result["modules"] = modules
+def _parse_name(result: dict, body: str) -> None:
+    result["name"] = body.replace("\n", " ")
+
+
+def _parse_description(result: dict, body: str) -> None:
+    result["description"] = body.replace("\n", " ")
+
+
+def _parse_enzymes(result: dict, body: str) -> None:
+    result["enzymes"] = _EC_RE.findall(body)
+
+
+def _parse_reactions(result: dict, body: str) -> None:
+    result["reactions"] = _REACTION_RE.findall(body)
+
+
+def _parse_compounds(result: dict, body: str) -> None:
+    result["compounds"] = [
+        {"id": compound_id, "name": name}
+        for compound_id, name in _COMPOUND_RE.findall(body)
+    ]
+
+
+def _parse_genes(result: dict, body: str) -> None:
+    # Format: gene_id  description (K number)
+    result["genes"] = [
+        {"id": gene_id, "description": description}
+        for gene_id, description in _GENE_RE.findall(body)[:50]  # Limit
+    ]
+
+
+def _parse_modules(result: dict, body: str) -> None:
+    result["modules"] = _MODULE_RE.findall(body)
+
+
+_SECTION_HANDLERS: dict[str, Callable[[dict, str], None]] = {
+    "NAME": _parse_name,
+    "DESCRIPTION": _parse_description,
+    "ENZYME": _parse_enzymes,
+    "REACTION": _parse_reactions,
+    "COMPOUND": _parse_compounds,
+    "GENE": _parse_genes,
+    "MODULE": _parse_modules,
+}
+
+
+def _process_section(result: dict, section: Optional[str], body: str) -> None:
+    """Process a section from KEGG flat file.
+
+    Args:
+        result: Parsed entry to update in place
+        section: Section keyword, e.g. 'NAME' or 'COMPOUND'
+        body: Stripped section lines joined with newlines
+    """
+    handler = _SECTION_HANDLERS.get(section)
+    if handler:
+        handler(result, body)
 
 
 def get_pathway_enzymes(pathway_id: str) -> dict[str, Any]:
@@ -131,12 +240,10 @@ def get_pathway_enzymes(pathway_id: str) -> dict[str, Any]:
     """
     try:
         # Get enzyme links for pathway
-        url = f"{KEGG_API}/link/enzyme/{pathway_id}"
-        response = requests.get(url, timeout=TIMEOUT)
-        response.raise_for_status()
+        text = _kegg_get(f"{KEGG_API}/link/enzyme/{pathway_id}")
 
         enzymes = []
-        for line in response.text.strip().split("\n"):
+        for line in text.strip().split("\n"):
             if line and "\t" in line:
                 _, enzyme_id = line.split("\t")
                 ec_number = enzyme_id.replace("ec:", "")
@@ -162,19 +269,18 @@ def get_pathway_enzymes(pathway_id: str) -> dict[str, Any]:
 def get_enzyme_info(ec_number: str) -> dict[str, Any]:
     """Get information about a specific enzyme."""
     try:
-        url = f"{KEGG_API}/get/ec:{ec_number}"
-        response = requests.get(url, timeout=TIMEOUT)
-        response.raise_for_status()
-
-        info = parse_kegg_flat_file(response.text)
+        info = parse_kegg_flat_file(_kegg_get(f"{KEGG_API}/get/ec:{ec_number}"))
         info["ec_number"] = ec_number
 
-        # Get organisms that have this enzyme
-        org_url = f"{KEGG_API}/link/genes/ec:{ec_number}"
-        org_response = requests.get(org_url, timeout=TIMEOUT)
+        # Get organisms that have this enzyme; the links are supplementary,
+        # so an HTTP error there leaves the organism list empty
+        try:
+            org_text = _kegg_get(f"{KEGG_API}/link/genes/ec:{ec_number}")
+        except requests.HTTPError:
+            org_text = ""
 
         organisms = defaultdict(list)
-        for line in org_response.text.strip().split("\n"):
+        for line in org_text.strip().split("\n"):
             if line and "\t" in line:
                 _, gene = line.split("\t")
                 # Gene format: org:gene_id
@@ -255,14 +361,12 @@ def compare_pathway_organisms(
 def _get_pathway_genes(pathway_id: str) -> list[str]:
     """Get genes for an organism-specific pathway."""
     try:
-        url = f"{KEGG_API}/link/genes/{pathway_id}"
-        response = requests.get(url, timeout=TIMEOUT)
-        genes = []
-        for line in response.text.strip().split("\n"):
-            if line and "\t" in line:
-                _, gene = line.split("\t")
-                genes.append(gene)
-        return genes
+        text = _kegg_get(f"{KEGG_API}/link/genes/{pathway_id}")
+        return [
+            line.split("\t", 1)[1]
+            for line in text.splitlines()
+            if "\t" in line
+        ]
     except Exception:
         return []
 
@@ -270,13 +374,10 @@ def _get_pathway_genes(pathway_id: str) -> list[str]:
 def _get_pathway_ko(pathway_id: str) -> dict[str, list[str]]:
     """Get KO assignments for a pathway."""
     try:
-        url = f"{KEGG_API}/link/ko/{pathway_id}"
-        response = requests.get(url, timeout=TIMEOUT)
+        text = _kegg_get(f"{KEGG_API}/link/ko/{pathway_id}")
         ko_map = defaultdict(list)
-        for line in response.text.strip().split("\n"):
-            if line and "\t" in line:
-                gene, ko = line.split("\t")
-                ko_map[ko.replace("ko:", "")].append(gene)
+        for gene, ko in (line.split("\t", 1) for line in text.splitlines() if "\t" in line):
+            ko_map[ko.removeprefix("ko:")].append(gene)
         return dict(ko_map)
     except Exception:
         return {}
@@ -302,35 +403,46 @@ def find_alternative_enzymes(
         Dict with alternative enzymes from different organisms
     """
     try:
-        # Get all genes with this EC number
-        url = f"{KEGG_API}/link/genes/ec:{ec_number}"
-        response = requests.get(url, timeout=TIMEOUT)
-        response.raise_for_status()
-
-        organisms = defaultdict(list)
-        for line in response.text.strip().split("\n"):
-            if line and "\t" in line:
-                _, gene = line.split("\t")
-                if ":" in gene:
-                    org, gene_id = gene.split(":", 1)
-
-                    # Skip source organism
-                    if source_organism and org == source_organism:
-                        continue
-
-                    # Filter by target organisms
-                    if target_organisms and org not in target_organisms:
-                        continue
-
-                    organisms[org].append(gene_id)
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kegg-names")
+        try:
+            # Download the organism list while the gene links are fetched
+            names_future = pool.submit(_get_organism_names)
+
+            # Get all genes with this EC number
+            text = _kegg_get(f"{KEGG_API}/link/genes/ec:{ec_number}")
+
+            organisms = defaultdict(list)
+            for line in text.strip().split("\n"):
+                if line and "\t" in line:
+                    _, gene = line.split("\t")
+                    if ":" in gene:
+                        org, gene_id = gene.split(":", 1)
+
+                        # Skip source organism
+                        if source_organism and org == source_organism:
+                            continue
+
+                        # Filter by target organisms
+                        if target_organisms and org not in target_organisms:
+                            continue
+
+                        organisms[org].append(gene_id)
+
+            try:
+                names = names_future.result()
+            except Exception:
+                names = {}
+        finally:
+            # Don't hold an error return until the organism list download
+            # times out; an abandoned download finishes on its own
+            pool.shutdown(wait=False, cancel_futures=True)
 
         # Get organism names
         results = []
         for org, genes in list(organisms.items())[:15]:
-            org_info = _get_organism_name(org)
             results.append({
                 "organism_code": org,
-                "organism_name": org_info,
+                "organism_name": names.get(org, org),
                 "genes": genes[:5],
                 "gene_count": len(genes)
             })
@@ -345,17 +457,26 @@ def find_alternative_enzymes(
         return {"error": str(e)}
 
 
+@functools.lru_cache(maxsize=1)
+def _get_organism_names() -> dict[str, str]:
+    """
+    Fetch the KEGG organism list as a code -> name mapping.
+
+    Memoized for the life of the process; failed fetches raise and are
+    therefore not cached.
+    """
+    names = {}
+    for line in _kegg_get(f"{KEGG_API}/list/organism").strip().split("\n"):
+        parts = line.split("\t")
+        if len(parts) >= 3:
+            names[parts[1]] = parts[2]
+    return names
+
+
 def _get_organism_name(org_code: str) -> str:
     """Get organism name from code."""
     try:
-        url = f"{KEGG_API}/list/organism"
-        response = requests.get(url, timeout=TIMEOUT)
-        for line in response.text.strip().split("\n"):
-            if f"\t{org_code}\t" in line:
-                parts = line.split("\t")
-                if len(parts) >= 3:
-                    return parts[2]
-        return org_code
+        return _get_organism_names().get(org_code, org_code)
     except Exception:
         return org_code
 
@@ -420,7 +541,7 @@ def analyze_nitrogen_fixation_pathway(organism: str = "avn") -> dict[str, Any]:
 
         # Search for nif genes
         url = f"{KEGG_API}/find/genes/nif+{organism}"
-        response = requests.get(url, timeout=TIMEOUT)
+        response = _SESSION.get(url, timeout=TIMEOUT)
         for line in response.text.strip().split("\n")[:20]:
             if line and "\t" in line:
                 gene_id, desc = line.split("\t", 1)
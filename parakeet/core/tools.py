@@ -1,15 +1,36 @@
 """Tool definitions for the Parakeet agent."""
 
+import fnmatch
+import inspect
+import json
+import os
 import re
+import shlex
 import sqlite3
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from ..ui import console
 
 
+def encode_result(result: dict[str, Any]) -> str:
+    """Serialize a tool result to a JSON string for the conversation.
+
+    Uses orjson when it is installed (much faster on large file contents
+    and row lists), falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(result)
+
+
 def resolve_abs_path(path_str: str) -> Path:
     """Convert relative path to absolute path."""
     path = Path(path_str).expanduser()
@@ -97,6 +118,21 @@ def edit_file_tool(path: str, old_str: str, new_str: str) -> dict[str, Any]:
     }
 
 
+# Characters that need a real shell (pipes, redirection, expansion, globbing, ...)
+_SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]{}~#!=\n")
+
+
+def _split_simple_command(command: str) -> Optional[list[str]]:
+    """Split a command into argv if it can run without a shell, else None."""
+    if any(c in _SHELL_METACHARS for c in command):
+        return None
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+    return args or None
+
+
 def run_bash_tool(
     command: str,
     timeout: Optional[float] = None,
@@ -149,22 +185,39 @@ def run_bash_tool(
         # Build environment
         exec_env = None
         if env:
-            import os
             exec_env = os.environ.copy()
             exec_env.update(env)
 
         # Determine working directory
         exec_cwd = resolve_abs_path(cwd) if cwd else Path.cwd()
 
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout_val,
-            cwd=str(exec_cwd),
-            env=exec_env
-        )
+        # Exec simple commands directly to skip the /bin/sh fork
+        result = None
+        args = _split_simple_command(command)
+        if args is not None:
+            try:
+                result = subprocess.run(
+                    args,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout_val,
+                    cwd=str(exec_cwd),
+                    env=exec_env
+                )
+            except OSError:
+                # Not an executable (e.g. a shell builtin like cd) - let the shell handle it
+                pass
+
+        if result is None:
+            result = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=timeout_val,
+                cwd=str(exec_cwd),
+                env=exec_env
+            )
         return {
             "stdout": result.stdout,
             "stderr": result.stderr,
@@ -304,12 +357,6 @@ def search_code_tool(pattern: str, path: str = ".", file_pattern: Optional[str]
     console.print(f"  [dim]Searching:[/] {search_path} for '{pattern}'")
     matches = []
 
-    # Determine files to search
-    if file_pattern:
-        files = search_path.rglob(file_pattern)
-    else:
-        files = search_path.rglob("*")
-
     # Common binary/ignored extensions
     ignore_ext = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.jpg', '.png', '.gif', '.pdf', '.ico', '.woff', '.woff2', '.ttf', '.eot'}
     ignore_dirs = {'.git', '.venv', 'venv', '__pycache__', 'node_modules', '.parakeet', '.mypy_cache', '.pytest_cache'}
@@ -319,28 +366,41 @@ def search_code_tool(pattern: str, path: str = ".", file_pattern: Optional[str]
     except re.error as e:
         return {"error": f"Invalid regex: {e}"}
 
-    for file in files:
-        # Skip directories and ignored paths
-        if file.is_dir():
-            continue
-        if any(ignored in file.parts for ignored in ignore_dirs):
-            continue
-        if file.suffix.lower() in ignore_ext:
-            continue
-
-        try:
-            content = file.read_text(encoding="utf-8", errors="ignore")
-            for i, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    matches.append({
-                        "file": str(file.relative_to(search_path)),
-                        "line": i,
-                        "content": line.strip()[:200]  # Truncate long lines
-                    })
-                    if len(matches) >= 50:  # Limit results
-                        return {"matches": matches, "truncated": True}
-        except Exception:
-            continue
+    # A bare name pattern is checked per file with fnmatch; anything with a
+    # separator (e.g. "src/**/*.py") keeps rglob()'s semantics, so collect
+    # its matches once up front
+    path_matches = None
+    if file_pattern and "/" in file_pattern:
+        path_matches = set(search_path.rglob(file_pattern))
+
+    for root, dirs, files in os.walk(search_path):
+        # Prune ignored directories so their subtrees are never visited
+        dirs[:] = [d for d in dirs if d not in ignore_dirs]
+
+        for name in files:
+            if os.path.splitext(name)[1].lower() in ignore_ext:
+                continue
+
+            file = Path(root) / name
+            if path_matches is not None:
+                if file not in path_matches:
+                    continue
+            elif file_pattern and not fnmatch.fnmatch(name, file_pattern):
+                continue
+
+            try:
+                content = file.read_text(encoding="utf-8", errors="ignore")
+                for i, line in enumerate(content.splitlines(), 1):
+                    if regex.search(line):
+                        matches.append({
+                            "file": str(file.relative_to(search_path)),
+                            "line": i,
+                            "content": line.strip()[:200]  # Truncate long lines
+                        })
+                        if len(matches) >= 50:  # Limit results
+                            return {"matches": matches, "truncated": True}
+            except Exception:
+                continue
 
     return {"matches": matches, "truncated": False}
 
@@ -838,6 +898,40 @@ TOOL_REGISTRY = {
     "find_alternatives_tool": find_alternatives_tool,
 }
 
+
+def _build_arg_validator(func: Callable[..., Any]) -> Callable[[dict[str, Any]], Optional[str]]:
+    """Build an argument checker for a tool from its signature."""
+    params = inspect.signature(func).parameters
+    allowed = frozenset(params)
+    required = frozenset(
+        name for name, param in params.items() if param.default is inspect.Parameter.empty
+    )
+
+    def validate(args: dict[str, Any]) -> Optional[str]:
+        unexpected = args.keys() - allowed
+        if unexpected:
+            return f"Unexpected argument(s): {', '.join(sorted(unexpected))}"
+        missing = required - args.keys()
+        if missing:
+            return f"Missing required argument(s): {', '.join(sorted(missing))}"
+        return None
+
+    return validate
+
+
+# Argument validators, built once from each tool's signature
+TOOL_VALIDATORS = {name: _build_arg_validator(func) for name, func in TOOL_REGISTRY.items()}
+
+
+def validate_tool_args(tool_name: str, args: dict[str, Any]) -> Optional[str]:
+    """Check tool arguments against the tool signature.
+
+    Returns:
+        Error message if the arguments don't fit the signature, None otherwise
+    """
+    return TOOL_VALIDATORS[tool_name](args)
+
+
 # Tools that require user confirmation before execution
 DANGEROUS_TOOLS = {"run_bash_tool", "run_python_tool", "install_deps_tool", "smart_commit_tool"}
 
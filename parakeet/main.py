@@ -30,6 +30,7 @@ def main(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Model name to use"),
     new: bool = typer.Option(False, "--new", "-n", help="Start a new session (don't resume last)"),
     multi_agent: bool = typer.Option(False, "--multi-agent", help="Enable multi-agent mode with specialist agents"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk KEGG lookup cache"),
 ) -> None:
     """AI coding agent for biotech and robotics."""
     if version:
@@ -39,7 +40,7 @@ def main(
 
     if ctx.invoked_subcommand is None:
         # Default to chat command
-        chat(host=host, model=model, new=new, multi_agent=multi_agent)
+        chat(host=host, model=model, new=new, multi_agent=multi_agent, no_cache=no_cache)
 
 
 if __name__ == "__main__":
@@ -1,40 +1,168 @@
 """Pytest configuration and fixtures."""
 
+import os
+import shutil
 import sqlite3
-import tempfile
 from pathlib import Path
 
 import pytest
+import typer.main
+from typer.testing import CliRunner
+
+
+# Modules skipped by --fast: they drive the full agent loop or Typer CLI
+FAST_IGNORE = {"test_agent.py", "test_cli.py"}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Smoke run: skip the agent loop and CLI test modules",
+    )
+
+
+def pytest_configure(config):
+    # Keep tmp_path trees on tmpfs when available. Only the temp root moves,
+    # so pytest still numbers runs (pytest-of-<user>/pytest-N) and prunes old
+    # ones; an explicit PYTEST_DEBUG_TEMPROOT or --basetemp wins
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
+
+def pytest_ignore_collect(collection_path, config):
+    if config.getoption("--fast") and collection_path.name in FAST_IGNORE:
+        return True
+    return None
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Shared Typer CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_app():
+    """The Parakeet Typer app, imported once per session."""
+    from parakeet.main import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def cli_command(cli_app):
+    """The Click command tree behind the Typer app, built once per session."""
+    return typer.main.get_command(cli_app)
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def isolated_config(tmp_path, monkeypatch):
+    """Point the global config at a file in tmp_path; returns its path."""
+    from parakeet.core import config as config_module
+    from parakeet.cli import config_cmd
+
+    config_file = tmp_path / "config.json"
+    monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
+    monkeypatch.setattr(config_module, "CONFIG_DIR", tmp_path)
+    # config_cmd imports CONFIG_FILE by name, so patch its copy too
+    monkeypatch.setattr(config_cmd, "CONFIG_FILE", config_file)
+    return config_file
 
 
 @pytest.fixture
-def temp_file(temp_dir):
+def temp_file(tmp_path):
     """Create a temporary file with content."""
     def _create_file(name: str, content: str) -> Path:
-        file_path = temp_dir / name
+        file_path = tmp_path / name
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(content, encoding="utf-8")
         return file_path
     return _create_file
 
 
-@pytest.fixture
-def temp_db(temp_dir):
-    """Create a temporary SQLite database."""
-    db_path = temp_dir / "test.db"
+@pytest.fixture(scope="session")
+def temp_file_fast():
+    """Write a file through an unnamed O_TMPFILE inode linked into place.
+
+    Returns a function (directory, name, data) -> Path. Falls back to a
+    plain write where O_TMPFILE is unavailable (non-Linux, some filesystems).
+    """
+    def _create_file(directory: Path, name: str, data: bytes) -> Path:
+        path = directory / name
+        try:
+            fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o600)
+        except (AttributeError, OSError):
+            path.write_bytes(data)
+            return path
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # Plain link(2) on the /proc symlink fails with EXDEV; linkat follows it
+            proc_fd = os.open("/proc/self/fd", os.O_RDONLY)
+            try:
+                os.link(str(fd), path, src_dir_fd=proc_fd)
+            finally:
+                os.close(proc_fd)
+        finally:
+            os.close(fd)
+        return path
+    return _create_file
+
+
+@pytest.fixture(scope="session")
+def sample_repo(tmp_path_factory):
+    """A minimal git checkout layout, shared by the whole session; treat as read-only."""
+    root = tmp_path_factory.mktemp("repo")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text("pattern_to_find\n")
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("other content\n")
+    return root
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory):
+    """Build the sample SQLite database once per session."""
+    db_path = tmp_path_factory.mktemp("db") / "template.db"
     conn = sqlite3.connect(str(db_path))
+    # Throwaway file: skip journaling and fsyncs while building it
+    conn.executescript("""
+        PRAGMA journal_mode=MEMORY;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA locking_mode=EXCLUSIVE;
+    """)
     conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)")
-    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'alice@example.com')")
-    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'bob@example.com')")
+    conn.executemany("INSERT INTO users VALUES (?, ?, ?)", [
+        (1, "Alice", "alice@example.com"),
+        (2, "Bob", "bob@example.com"),
+    ])
     conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL)")
     conn.execute("INSERT INTO orders VALUES (1, 1, 99.99)")
     conn.commit()
     conn.close()
+    # Shared by every readonly_db test: make accidental writes fail loudly.
+    # temp_db copies with shutil.copyfile, which does not carry the mode over
+    os.chmod(db_path, 0o444)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def readonly_db(template_db):
+    """Path string of the shared template database, for tests that only read it."""
+    return str(template_db)
+
+
+@pytest.fixture
+def temp_db(tmp_path, template_db):
+    """Create a temporary SQLite database (a private copy of the template).
+
+    sqlite_tool opens its own connection and commits, so a savepoint held
+    by the test cannot roll its writes back; a file copy of the session
+    template is the cheapest way to give mutating tests a clean database.
+    """
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db, db_path)
     return db_path
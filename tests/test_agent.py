@@ -1,19 +1,52 @@
 """Tests for Parakeet agent."""
 
 import json
-from unittest.mock import MagicMock, patch, call
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
 from parakeet.core import agent
 
 
+@dataclass(slots=True, frozen=True)
+class _Function:
+    name: str
+    arguments: dict
+
+
+@dataclass(slots=True, frozen=True)
+class _ToolCall:
+    function: _Function
+
+
+@dataclass(slots=True, frozen=True)
+class _Msg:
+    content: str
+    tool_calls: Optional[list] = None
+
+
+@dataclass(slots=True, frozen=True)
+class _Chunk:
+    message: _Msg
+
+
+# Streamed chunks shared by the stream_response tests
+HELLO = _Chunk(_Msg("Hello "))
+WORLD = _Chunk(_Msg("World!"))
+READ_FILE_CALL = _Chunk(_Msg("", [_ToolCall(_Function("read_file_tool", {"path": "test.py"}))]))
+LET_ME_CHECK = _Chunk(_Msg("Let me check "))
+THE_FILES_WITH_CALL = _Chunk(_Msg("the files.", [_ToolCall(_Function("list_files_tool", {"path": "."}))]))
+
+
 class TestBuildSystemPrompt:
     """Tests for build_system_prompt."""
 
     def test_basic_prompt_without_context(self):
         """Returns base system prompt when no project context."""
-        with patch("parakeet.core.agent.load_project_context", return_value=None):
+        with patch.object(agent, "load_project_context", new=lambda: None):
             result = agent.build_system_prompt()
 
         assert "coding assistant" in result
@@ -24,178 +57,86 @@ class TestBuildSystemPrompt:
         """Appends project context to system prompt."""
         context = "This is a bioinformatics project using BioPython."
 
-        with patch("parakeet.core.agent.load_project_context", return_value=context):
+        with patch.object(agent, "load_project_context", new=lambda: context):
             result = agent.build_system_prompt()
 
         assert "Project Context" in result
         assert context in result
 
 
-class TestConfirmExecution:
-    """Tests for confirm_execution."""
-
-    def test_confirm_yes(self):
-        """Returns True when user confirms with 'y'."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.return_value = "y"
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is True
-
-    def test_confirm_yes_uppercase(self):
-        """Returns True when user confirms with 'Y'."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.return_value = "Y"
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is True
-
-    def test_confirm_yes_full(self):
-        """Returns True when user confirms with 'yes'."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.return_value = "yes"
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is True
-
-    def test_confirm_no(self):
-        """Returns False when user declines with 'n'."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.return_value = "n"
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is False
-
-    def test_confirm_empty(self):
-        """Returns False when user presses enter (empty input)."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.return_value = ""
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is False
-
-    def test_confirm_keyboard_interrupt(self):
-        """Returns False on keyboard interrupt."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.side_effect = KeyboardInterrupt()
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is False
+@pytest.fixture(scope="class")
+def class_mock_console():
+    """Patch the agent console once for a whole test class."""
+    with patch("parakeet.core.agent.console") as mock_console:
+        yield mock_console
 
-    def test_confirm_eof(self):
-        """Returns False on EOF."""
-        with patch("parakeet.core.agent.console") as mock_console:
-            mock_console.input.side_effect = EOFError()
-            result = agent.confirm_execution("run_bash_tool", "echo hello")
-
-        assert result is False
 
+class TestConfirmExecution:
+    """Tests for confirm_execution."""
 
+    @pytest.fixture(autouse=True)
+    def _mock_console(self, class_mock_console):
+        class_mock_console.reset_mock(return_value=True, side_effect=True)
+        self.mock_console = class_mock_console
+
+    @pytest.mark.parametrize("user_input,expected", [
+        ("y", True),
+        ("Y", True),
+        ("yes", True),
+        ("n", False),
+        ("", False),
+        (KeyboardInterrupt(), False),
+        (EOFError(), False),
+    ], ids=["yes", "yes_uppercase", "yes_full", "no", "empty", "keyboard_interrupt", "eof"])
+    def test_confirm(self, user_input, expected):
+        """Approves only on an explicit yes; interrupts count as no."""
+        if isinstance(user_input, BaseException):
+            self.mock_console.input.side_effect = user_input
+        else:
+            self.mock_console.input.return_value = user_input
+        approved, sudo_password = agent.confirm_execution("run_bash_tool", "echo hello")
+
+        assert approved is expected
+        assert sudo_password is None
+
+
+@pytest.mark.usefixtures("class_mock_console")
 class TestStreamResponse:
     """Tests for stream_response."""
 
-    def test_stream_content_only(self):
-        """Streams content without tool calls."""
-        mock_client = MagicMock()
-
-        # Create mock chunks
-        chunk1 = MagicMock()
-        chunk1.message.content = "Hello "
-        chunk1.message.tool_calls = None
-
-        chunk2 = MagicMock()
-        chunk2.message.content = "World!"
-        chunk2.message.tool_calls = None
-
-        mock_client.chat.return_value = [chunk1, chunk2]
-
-        with patch("parakeet.core.agent.console"):
-            content, tool_calls = agent.stream_response(
-                mock_client, "llama3.2", [], []
-            )
-
-        assert content == "Hello World!"
-        assert tool_calls == []
-
-    def test_stream_with_tool_calls(self):
-        """Collects tool calls from stream."""
-        mock_client = MagicMock()
-
-        # Create mock tool call
-        mock_tool_call = MagicMock()
-        mock_tool_call.function.name = "read_file_tool"
-        mock_tool_call.function.arguments = {"path": "test.py"}
-
-        chunk = MagicMock()
-        chunk.message.content = ""
-        chunk.message.tool_calls = [mock_tool_call]
-
-        mock_client.chat.return_value = [chunk]
+    @pytest.mark.parametrize("chunks,expected_content,expected_tools", [
+        ([HELLO, WORLD], "Hello World!", []),
+        ([READ_FILE_CALL], "", ["read_file_tool"]),
+        ([LET_ME_CHECK, THE_FILES_WITH_CALL], "Let me check the files.", ["list_files_tool"]),
+        ([], "", []),
+    ], ids=["content_only", "tool_calls", "mixed_content_and_tools", "empty"])
+    def test_stream(self, chunks, expected_content, expected_tools):
+        """Collects streamed content and tool calls."""
+        client = SimpleNamespace(chat=lambda **_: chunks)
 
-        with patch("parakeet.core.agent.console"):
-            content, tool_calls = agent.stream_response(
-                mock_client, "llama3.2", [], []
-            )
+        content, tool_calls = agent.stream_response(
+            client, "llama3.2", [], []
+        )
 
-        assert content == ""
-        assert len(tool_calls) == 1
-        assert tool_calls[0].function.name == "read_file_tool"
+        assert content == expected_content
+        assert [tc.function.name for tc in tool_calls] == expected_tools
 
-    def test_stream_mixed_content_and_tools(self):
-        """Handles both content and tool calls."""
-        mock_client = MagicMock()
 
-        mock_tool_call = MagicMock()
-        mock_tool_call.function.name = "list_files_tool"
-        mock_tool_call.function.arguments = {"path": "."}
-
-        chunk1 = MagicMock()
-        chunk1.message.content = "Let me check "
-        chunk1.message.tool_calls = None
-
-        chunk2 = MagicMock()
-        chunk2.message.content = "the files."
-        chunk2.message.tool_calls = [mock_tool_call]
-
-        mock_client.chat.return_value = [chunk1, chunk2]
-
-        with patch("parakeet.core.agent.console"):
-            content, tool_calls = agent.stream_response(
-                mock_client, "llama3.2", [], []
-            )
-
-        assert content == "Let me check the files."
-        assert len(tool_calls) == 1
-
-    def test_stream_empty_response(self):
-        """Handles empty response."""
-        mock_client = MagicMock()
-        mock_client.chat.return_value = []
-
-        with patch("parakeet.core.agent.console"):
-            content, tool_calls = agent.stream_response(
-                mock_client, "llama3.2", [], []
-            )
-
-        assert content == ""
-        assert tool_calls == []
+@pytest.fixture(scope="class")
+def prompt_lower():
+    """Lowercased system prompt, computed once per test class."""
+    return agent.SYSTEM_PROMPT.lower()
 
 
 class TestSystemPromptContent:
     """Tests for SYSTEM_PROMPT content."""
 
-    def test_contains_bioinformatics(self):
-        """System prompt includes bioinformatics expertise."""
-        assert "BioPython" in agent.SYSTEM_PROMPT or "bioinformatics" in agent.SYSTEM_PROMPT.lower()
-
-    def test_contains_robotics(self):
-        """System prompt includes robotics expertise."""
-        assert "ROS2" in agent.SYSTEM_PROMPT or "robotics" in agent.SYSTEM_PROMPT.lower()
-
-    def test_contains_tools_mention(self):
-        """System prompt mentions available tools."""
-        assert "tool" in agent.SYSTEM_PROMPT.lower()
-
-    def test_contains_guidelines(self):
-        """System prompt includes coding guidelines."""
-        assert "type hint" in agent.SYSTEM_PROMPT.lower() or "docstring" in agent.SYSTEM_PROMPT.lower()
+    @pytest.mark.parametrize("needles", [
+        ("biopython", "bioinformatics"),
+        ("ros2", "robotics"),
+        ("tool",),
+        ("type hint", "docstring"),
+    ], ids=["bioinformatics", "robotics", "tools", "guidelines"])
+    def test_contains(self, prompt_lower, needles):
+        """System prompt covers the expected expertise and guidelines."""
+        assert any(needle in prompt_lower for needle in needles)
@@ -1,10 +1,15 @@
 """Tests for Parakeet bioinformatics tools."""
 
-from unittest.mock import patch, MagicMock
-
 import pytest
+import responses
 
 from parakeet.core.bio_tools import (
+    KEGG_API,
+    PDB_API,
+    PDB_SEARCH_API,
+    UNIPROT_API,
+    NCBI_API,
+    EBI_OLS_API,
     kegg_tool,
     pdb_tool,
     uniprot_tool,
@@ -14,41 +19,42 @@ from parakeet.core.bio_tools import (
 )
 
 
+@pytest.fixture
+def http():
+    """Intercept outgoing requests; tests register the responses they need."""
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
 class TestKeggTool:
     """Tests for kegg_tool."""
 
-    def test_find_operation(self):
+    def test_find_operation(self, http):
         """Tests KEGG find operation."""
-        mock_response = MagicMock()
-        mock_response.text = "path:map00910\tNitrogen metabolism\npath:map01310\tNitrogen cycle"
-        mock_response.raise_for_status = MagicMock()
+        http.get(
+            f"{KEGG_API}/find/pathway/nitrogen",
+            body="path:map00910\tNitrogen metabolism\npath:map01310\tNitrogen cycle"
+        )
 
-        with patch("requests.get", return_value=mock_response):
-            result = kegg_tool("nitrogen", operation="find", database="pathway")
+        result = kegg_tool("nitrogen", operation="find", database="pathway")
 
         assert result["count"] == 2
         assert result["results"][0]["id"] == "path:map00910"
 
-    def test_get_operation(self):
+    def test_get_operation(self, http):
         """Tests KEGG get operation."""
-        mock_response = MagicMock()
-        mock_response.text = "ENTRY map00910\nNAME Nitrogen metabolism"
-        mock_response.raise_for_status = MagicMock()
+        http.get(f"{KEGG_API}/get/map00910", body="ENTRY map00910\nNAME Nitrogen metabolism")
 
-        with patch("requests.get", return_value=mock_response):
-            result = kegg_tool("map00910", operation="get")
+        result = kegg_tool("map00910", operation="get")
 
         assert "content" in result
         assert "ENTRY" in result["content"]
 
-    def test_list_operation(self):
+    def test_list_operation(self, http):
         """Tests KEGG list operation."""
-        mock_response = MagicMock()
-        mock_response.text = "ec:1.1.1.1\talcohol dehydrogenase"
-        mock_response.raise_for_status = MagicMock()
+        http.get(f"{KEGG_API}/list/enzyme", body="ec:1.1.1.1\talcohol dehydrogenase")
 
-        with patch("requests.get", return_value=mock_response):
-            result = kegg_tool("*", operation="list", database="enzyme")
+        result = kegg_tool("*", operation="list", database="enzyme")
 
         assert result["count"] == 1
 
@@ -57,48 +63,44 @@ class TestKeggTool:
         result = kegg_tool("test", operation="invalid")
         assert "error" in result
 
-    def test_api_error(self):
+    def test_api_error(self, http):
         """Handles API errors gracefully."""
-        with patch("requests.get", side_effect=Exception("Connection error")):
-            result = kegg_tool("test", operation="find")
+        http.get(f"{KEGG_API}/find/pathway/test", body=Exception("Connection error"))
+
+        result = kegg_tool("test", operation="find")
+
         assert "error" in result
 
 
 class TestPdbTool:
     """Tests for pdb_tool."""
 
-    def test_get_operation(self):
+    def test_get_operation(self, http):
         """Tests PDB get operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{PDB_API}/core/entry/1ABC", json={
             "struct": {"title": "Test Structure"},
             "exptl": [{"method": "X-RAY DIFFRACTION"}],
             "rcsb_entry_info": {"resolution_combined": [2.0]},
             "rcsb_accession_info": {"deposit_date": "2020-01-01"},
             "struct_keywords": {"pdbx_keywords": "PROTEIN"}
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = pdb_tool("1ABC", operation="get")
+        result = pdb_tool("1ABC", operation="get")
 
         assert result["pdb_id"] == "1ABC"
         assert result["title"] == "Test Structure"
 
-    def test_search_operation(self):
+    def test_search_operation(self, http):
         """Tests PDB search operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.post(PDB_SEARCH_API, json={
             "result_set": [
                 {"identifier": "1ABC", "score": 1.0},
                 {"identifier": "2DEF", "score": 0.9}
             ],
             "total_count": 2
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.post", return_value=mock_response):
-            result = pdb_tool("nitrogenase", operation="search")
+        result = pdb_tool("nitrogenase", operation="search")
 
         assert result["total_count"] == 2
         assert len(result["results"]) == 2
@@ -134,10 +136,9 @@ class TestBuildPdbSearchQuery:
 class TestUniprotTool:
     """Tests for uniprot_tool."""
 
-    def test_get_operation(self):
+    def test_get_operation(self, http):
         """Tests UniProt get operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{UNIPROT_API}/uniprotkb/P12345.json", json={
             "primaryAccession": "P12345",
             "proteinDescription": {
                 "recommendedName": {"fullName": {"value": "Test Protein"}}
@@ -146,19 +147,16 @@ class TestUniprotTool:
             "sequence": {"value": "MKTLV", "length": 5},
             "comments": [],
             "uniProtKBCrossReferences": []
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = uniprot_tool("P12345", operation="get")
+        result = uniprot_tool("P12345", operation="get")
 
         assert result["accession"] == "P12345"
         assert result["name"] == "Test Protein"
 
-    def test_search_operation(self):
+    def test_search_operation(self, http):
         """Tests UniProt search operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{UNIPROT_API}/uniprotkb/search", json={
             "results": [
                 {
                     "primaryAccession": "P12345",
@@ -169,23 +167,18 @@ class TestUniprotTool:
                     "sequence": {"length": 100}
                 }
             ]
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = uniprot_tool("nitrogenase", operation="search")
+        result = uniprot_tool("nitrogenase", operation="search")
 
         assert result["count"] == 1
         assert result["results"][0]["accession"] == "P12345"
 
-    def test_fasta_operation(self):
+    def test_fasta_operation(self, http):
         """Tests UniProt FASTA operation."""
-        mock_response = MagicMock()
-        mock_response.text = ">sp|P12345|TEST\nMKTLV"
-        mock_response.raise_for_status = MagicMock()
+        http.get(f"{UNIPROT_API}/uniprotkb/P12345.fasta", body=">sp|P12345|TEST\nMKTLV")
 
-        with patch("requests.get", return_value=mock_response):
-            result = uniprot_tool("P12345", operation="fasta")
+        result = uniprot_tool("P12345", operation="fasta")
 
         assert "fasta" in result
         assert ">sp|P12345" in result["fasta"]
@@ -194,27 +187,23 @@ class TestUniprotTool:
 class TestNcbiTool:
     """Tests for ncbi_tool."""
 
-    def test_search_operation(self):
+    def test_search_operation(self, http):
         """Tests NCBI search operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{NCBI_API}/esearch.fcgi", json={
             "esearchresult": {
                 "idlist": ["123", "456"],
                 "count": "2"
             }
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = ncbi_tool("nitrogenase", database="protein", operation="search")
+        result = ncbi_tool("nitrogenase", database="protein", operation="search")
 
         assert result["count"] == 2
         assert result["ids"] == ["123", "456"]
 
-    def test_summary_operation(self):
+    def test_summary_operation(self, http):
         """Tests NCBI summary operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{NCBI_API}/esummary.fcgi", json={
             "result": {
                 "uids": ["123"],
                 "123": {
@@ -223,23 +212,18 @@ class TestNcbiTool:
                     "accessionversion": "ABC123"
                 }
             }
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = ncbi_tool("123", database="protein", operation="summary")
+        result = ncbi_tool("123", database="protein", operation="summary")
 
         assert len(result["results"]) == 1
         assert result["results"][0]["title"] == "Test protein"
 
-    def test_fetch_operation(self):
+    def test_fetch_operation(self, http):
         """Tests NCBI fetch operation."""
-        mock_response = MagicMock()
-        mock_response.text = ">ABC123\nMKTLV"
-        mock_response.raise_for_status = MagicMock()
+        http.get(f"{NCBI_API}/efetch.fcgi", body=">ABC123\nMKTLV")
 
-        with patch("requests.get", return_value=mock_response):
-            result = ncbi_tool("123", database="protein", operation="fetch")
+        result = ncbi_tool("123", database="protein", operation="fetch")
 
         assert result["format"] == "fasta"
         assert "MKTLV" in result["content"]
@@ -248,10 +232,9 @@ class TestNcbiTool:
 class TestOntologyTool:
     """Tests for ontology_tool."""
 
-    def test_search_operation(self):
+    def test_search_operation(self, http):
         """Tests ontology search operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{EBI_OLS_API}/search", json={
             "response": {
                 "docs": [
                     {
@@ -262,19 +245,16 @@ class TestOntologyTool:
                     }
                 ]
             }
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = ontology_tool("nitrogen fixation", ontology="go", operation="search")
+        result = ontology_tool("nitrogen fixation", ontology="go", operation="search")
 
         assert result["count"] == 1
         assert result["results"][0]["id"] == "GO:0009399"
 
-    def test_get_operation(self):
+    def test_get_operation(self, http):
         """Tests ontology get operation."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        http.get(f"{EBI_OLS_API}/ontologies/go/terms", json={
             "_embedded": {
                 "terms": [{
                     "obo_id": "GO:0009399",
@@ -284,11 +264,9 @@ class TestOntologyTool:
                     "ontology_name": "go"
                 }]
             }
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
-        with patch("requests.get", return_value=mock_response):
-            result = ontology_tool("GO:0009399", ontology="go", operation="get")
+        result = ontology_tool("GO:0009399", ontology="go", operation="get")
 
         assert result["id"] == "GO:0009399"
         assert result["label"] == "nitrogen fixation"
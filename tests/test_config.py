@@ -13,15 +13,15 @@ from parakeet.core import config
 class TestLoadConfig:
     """Tests for load_config."""
 
-    def test_load_config_file_not_exists(self, monkeypatch, temp_dir):
+    def test_load_config_file_not_exists(self, monkeypatch, tmp_path):
         """Returns empty dict when config file doesn't exist."""
-        monkeypatch.setattr(config, "CONFIG_FILE", temp_dir / "nonexistent.json")
+        monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "nonexistent.json")
         result = config.load_config()
         assert result == {}
 
-    def test_load_config_valid_json(self, monkeypatch, temp_dir):
+    def test_load_config_valid_json(self, monkeypatch, tmp_path):
         """Loads config from valid JSON file."""
-        config_file = temp_dir / "config.json"
+        config_file = tmp_path / "config.json"
         config_data = {"ollama_host": "http://localhost:11434", "ollama_model": "llama3.2"}
         config_file.write_text(json.dumps(config_data))
 
@@ -30,9 +30,9 @@ class TestLoadConfig:
 
         assert result == config_data
 
-    def test_load_config_invalid_json(self, monkeypatch, temp_dir):
+    def test_load_config_invalid_json(self, monkeypatch, tmp_path):
         """Returns empty dict for invalid JSON."""
-        config_file = temp_dir / "config.json"
+        config_file = tmp_path / "config.json"
         config_file.write_text("not valid json {{{")
 
         monkeypatch.setattr(config, "CONFIG_FILE", config_file)
@@ -44,9 +44,9 @@ class TestLoadConfig:
 class TestSaveConfig:
     """Tests for save_config."""
 
-    def test_save_config_creates_directory(self, monkeypatch, temp_dir):
+    def test_save_config_creates_directory(self, monkeypatch, tmp_path):
         """Creates config directory if it doesn't exist."""
-        config_dir = temp_dir / "new_dir"
+        config_dir = tmp_path / "new_dir"
         config_file = config_dir / "config.json"
 
         monkeypatch.setattr(config, "CONFIG_DIR", config_dir)
@@ -57,10 +57,10 @@ class TestSaveConfig:
         assert config_dir.exists()
         assert config_file.exists()
 
-    def test_save_config_writes_json(self, monkeypatch, temp_dir):
+    def test_save_config_writes_json(self, monkeypatch, tmp_path):
         """Saves config as formatted JSON."""
-        config_file = temp_dir / "config.json"
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
         monkeypatch.setattr(config, "CONFIG_FILE", config_file)
 
         config_data = {"ollama_host": "http://localhost:11434", "ollama_model": "llama3.2"}
@@ -69,12 +69,12 @@ class TestSaveConfig:
         saved = json.loads(config_file.read_text())
         assert saved == config_data
 
-    def test_save_config_overwrites_existing(self, monkeypatch, temp_dir):
+    def test_save_config_overwrites_existing(self, monkeypatch, tmp_path):
         """Overwrites existing config file."""
-        config_file = temp_dir / "config.json"
+        config_file = tmp_path / "config.json"
         config_file.write_text(json.dumps({"old": "data"}))
 
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
         monkeypatch.setattr(config, "CONFIG_FILE", config_file)
 
         config.save_config({"new": "data"})
@@ -86,28 +86,28 @@ class TestSaveConfig:
 class TestLoadProjectContext:
     """Tests for load_project_context."""
 
-    def test_load_context_file_exists(self, monkeypatch, temp_dir):
+    def test_load_context_file_exists(self, monkeypatch, tmp_path):
         """Loads context from .parakeet/context.md."""
-        context_dir = temp_dir / ".parakeet"
+        context_dir = tmp_path / ".parakeet"
         context_dir.mkdir()
         context_file = context_dir / "context.md"
         context_file.write_text("# Project Context\n\nThis is my project.")
 
-        monkeypatch.chdir(temp_dir)
+        monkeypatch.chdir(tmp_path)
         result = config.load_project_context()
 
         assert result == "# Project Context\n\nThis is my project."
 
-    def test_load_context_file_not_exists(self, monkeypatch, temp_dir):
+    def test_load_context_file_not_exists(self, monkeypatch, tmp_path):
         """Returns None when context file doesn't exist."""
-        monkeypatch.chdir(temp_dir)
+        monkeypatch.chdir(tmp_path)
         result = config.load_project_context()
 
         assert result is None
 
-    def test_load_context_directory_not_exists(self, monkeypatch, temp_dir):
+    def test_load_context_directory_not_exists(self, monkeypatch, tmp_path):
         """Returns None when .parakeet directory doesn't exist."""
-        monkeypatch.chdir(temp_dir)
+        monkeypatch.chdir(tmp_path)
         result = config.load_project_context()
 
         assert result is None
@@ -153,10 +153,10 @@ class TestListAvailableModels:
 class TestGetOllamaConfig:
     """Tests for get_ollama_config."""
 
-    def test_config_from_arguments(self, monkeypatch, temp_dir):
+    def test_config_from_arguments(self, monkeypatch, tmp_path):
         """Uses host and model from function arguments."""
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
-        monkeypatch.setattr(config, "CONFIG_FILE", temp_dir / "config.json")
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
 
         with patch("parakeet.core.config.Client"):
             host, model = config.get_ollama_config(
@@ -168,15 +168,15 @@ class TestGetOllamaConfig:
         assert host == "http://custom:11434"
         assert model == "custom-model"
 
-    def test_config_from_config_file(self, monkeypatch, temp_dir):
+    def test_config_from_config_file(self, monkeypatch, tmp_path):
         """Uses host and model from config file."""
-        config_file = temp_dir / "config.json"
+        config_file = tmp_path / "config.json"
         config_file.write_text(json.dumps({
             "ollama_host": "http://saved:11434",
             "ollama_model": "saved-model"
         }))
 
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
         monkeypatch.setattr(config, "CONFIG_FILE", config_file)
 
         with patch("parakeet.core.config.Client"):
@@ -185,10 +185,10 @@ class TestGetOllamaConfig:
         assert host == "http://saved:11434"
         assert model == "saved-model"
 
-    def test_config_from_environment(self, monkeypatch, temp_dir):
+    def test_config_from_environment(self, monkeypatch, tmp_path):
         """Uses host and model from environment variables."""
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
-        monkeypatch.setattr(config, "CONFIG_FILE", temp_dir / "config.json")
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
         monkeypatch.setenv("OLLAMA_HOST", "http://env:11434")
         monkeypatch.setenv("OLLAMA_MODEL", "env-model")
 
@@ -198,10 +198,10 @@ class TestGetOllamaConfig:
         assert host == "http://env:11434"
         assert model == "env-model"
 
-    def test_config_default_fallback(self, monkeypatch, temp_dir):
+    def test_config_default_fallback(self, monkeypatch, tmp_path):
         """Uses default values when nothing else specified."""
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
-        monkeypatch.setattr(config, "CONFIG_FILE", temp_dir / "config.json")
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "config.json")
         monkeypatch.delenv("OLLAMA_HOST", raising=False)
         monkeypatch.delenv("OLLAMA_MODEL", raising=False)
 
@@ -211,15 +211,15 @@ class TestGetOllamaConfig:
         assert host == "http://localhost:11434"
         assert model == "llama3.2"
 
-    def test_config_priority_args_over_file(self, monkeypatch, temp_dir):
+    def test_config_priority_args_over_file(self, monkeypatch, tmp_path):
         """Function arguments take priority over config file."""
-        config_file = temp_dir / "config.json"
+        config_file = tmp_path / "config.json"
         config_file.write_text(json.dumps({
             "ollama_host": "http://saved:11434",
             "ollama_model": "saved-model"
         }))
 
-        monkeypatch.setattr(config, "CONFIG_DIR", temp_dir)
+        monkeypatch.setattr(config, "CONFIG_DIR", tmp_path)
         monkeypatch.setattr(config, "CONFIG_FILE", config_file)
 
         with patch("parakeet.core.config.Client"):
@@ -9,44 +9,48 @@ import pytest
 from parakeet.core import environment
 
 
+@pytest.fixture(autouse=True)
+def _reset_package_manager_cache():
+    """Make every test probe PATH for package managers afresh."""
+    environment.reset_package_manager_cache()
+
+
 class TestDetectPackageManager:
     """Tests for detect_package_manager."""
 
     def test_detect_uv(self):
         """Detects uv when available."""
-        with patch("shutil.which") as mock_which:
-            mock_which.side_effect = lambda x: "/usr/bin/uv" if x == "uv" else None
+        with patch("shutil.which", new=lambda cmd: "/usr/bin/uv" if cmd == "uv" else None):
             result = environment.detect_package_manager()
         assert result == "uv"
 
     def test_detect_conda(self):
         """Detects conda when uv not available."""
-        with patch("shutil.which") as mock_which:
-            def which_side_effect(cmd):
-                if cmd == "conda":
-                    return "/usr/bin/conda"
-                return None
-            mock_which.side_effect = which_side_effect
+        with patch("shutil.which", new=lambda cmd: "/usr/bin/conda" if cmd == "conda" else None):
             result = environment.detect_package_manager()
         assert result == "conda"
 
     def test_detect_venv(self):
         """Falls back to venv when no package manager."""
-        with patch("shutil.which") as mock_which:
-            def which_side_effect(cmd):
-                if cmd == "python3":
-                    return "/usr/bin/python3"
-                return None
-            mock_which.side_effect = which_side_effect
+        with patch("shutil.which", new=lambda cmd: "/usr/bin/python3" if cmd == "python3" else None):
             result = environment.detect_package_manager()
         assert result == "venv"
 
     def test_detect_none(self):
         """Returns None when nothing available."""
-        with patch("shutil.which", return_value=None):
+        with patch("shutil.which", new=lambda cmd: None):
             result = environment.detect_package_manager()
         assert result is None
 
+    def test_detection_is_cached(self):
+        """Probes PATH once until the cache is reset."""
+        with patch("shutil.which", new=lambda cmd: "/usr/bin/uv" if cmd == "uv" else None):
+            environment.detect_package_manager()
+        with patch("shutil.which", new=lambda cmd: None):
+            assert environment.detect_package_manager() == "uv"
+            environment.reset_package_manager_cache()
+            assert environment.detect_package_manager() is None
+
 
 class TestGetPackageManagerVersion:
     """Tests for get_package_manager_version."""
@@ -82,57 +86,57 @@ class TestGetPackageManagerVersion:
 class TestCreateVenv:
     """Tests for create_venv."""
 
-    def test_create_venv_path_not_exists(self, temp_dir):
+    def test_create_venv_path_not_exists(self, tmp_path):
         """Returns error if path doesn't exist."""
-        result = environment.create_venv(temp_dir / "nonexistent")
+        result = environment.create_venv(tmp_path / "nonexistent")
         assert "error" in result
 
-    def test_create_venv_already_exists(self, temp_dir):
+    def test_create_venv_already_exists(self, tmp_path):
         """Returns exists status if venv already present."""
-        venv_path = temp_dir / ".venv"
+        venv_path = tmp_path / ".venv"
         venv_path.mkdir()
 
-        result = environment.create_venv(temp_dir)
+        result = environment.create_venv(tmp_path)
 
         assert result["status"] == "exists"
         assert result["path"] == str(venv_path)
 
-    def test_create_venv_no_manager(self, temp_dir):
+    def test_create_venv_no_manager(self, tmp_path):
         """Returns error if no package manager."""
         with patch.object(environment, "detect_package_manager", return_value=None):
-            result = environment.create_venv(temp_dir)
+            result = environment.create_venv(tmp_path)
         assert "error" in result
         assert "No package manager" in result["error"]
 
-    def test_create_venv_with_uv(self, temp_dir):
+    def test_create_venv_with_uv(self, tmp_path):
         """Creates venv with uv."""
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
-            result = environment.create_venv(temp_dir, manager="uv")
+            result = environment.create_venv(tmp_path, manager="uv")
 
         assert result["status"] == "created"
         assert result["manager"] == "uv"
         mock_run.assert_called_once()
         assert "uv" in mock_run.call_args[0][0]
 
-    def test_create_venv_with_python_version(self, temp_dir):
+    def test_create_venv_with_python_version(self, tmp_path):
         """Passes python version to uv."""
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
-            environment.create_venv(temp_dir, manager="uv", python_version="3.11")
+            environment.create_venv(tmp_path, manager="uv", python_version="3.11")
 
         cmd = mock_run.call_args[0][0]
         assert "--python" in cmd
         assert "3.11" in cmd
 
-    def test_create_venv_failure(self, temp_dir):
+    def test_create_venv_failure(self, tmp_path):
         """Handles venv creation failure."""
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=1, stderr="Error message")
-            result = environment.create_venv(temp_dir, manager="uv")
+            result = environment.create_venv(tmp_path, manager="uv")
 
         assert "error" in result
 
@@ -140,38 +144,38 @@ class TestCreateVenv:
 class TestGetVenvInfo:
     """Tests for get_venv_info."""
 
-    def test_no_venv(self, temp_dir):
+    def test_no_venv(self, tmp_path):
         """Returns exists=False when no venv."""
-        result = environment.get_venv_info(temp_dir)
+        result = environment.get_venv_info(tmp_path)
         assert result["exists"] is False
 
-    def test_venv_exists(self, temp_dir):
+    def test_venv_exists(self, tmp_path):
         """Returns info when venv exists."""
-        venv_path = temp_dir / ".venv"
+        venv_path = tmp_path / ".venv"
         venv_path.mkdir()
 
-        result = environment.get_venv_info(temp_dir)
+        result = environment.get_venv_info(tmp_path)
 
         assert result["exists"] is True
         assert result["path"] == str(venv_path)
 
-    def test_detects_pyproject(self, temp_dir):
+    def test_detects_pyproject(self, tmp_path):
         """Detects pyproject.toml."""
-        venv_path = temp_dir / ".venv"
+        venv_path = tmp_path / ".venv"
         venv_path.mkdir()
-        (temp_dir / "pyproject.toml").write_text("[project]")
+        (tmp_path / "pyproject.toml").write_text("[project]")
 
-        result = environment.get_venv_info(temp_dir)
+        result = environment.get_venv_info(tmp_path)
 
         assert result["project_type"] == "pyproject.toml"
 
-    def test_detects_requirements(self, temp_dir):
+    def test_detects_requirements(self, tmp_path):
         """Detects requirements.txt."""
-        venv_path = temp_dir / ".venv"
+        venv_path = tmp_path / ".venv"
         venv_path.mkdir()
-        (temp_dir / "requirements.txt").write_text("requests")
+        (tmp_path / "requirements.txt").write_text("requests")
 
-        result = environment.get_venv_info(temp_dir)
+        result = environment.get_venv_info(tmp_path)
 
         assert result["project_type"] == "requirements.txt"
 
@@ -179,53 +183,53 @@ class TestGetVenvInfo:
 class TestInstallDependencies:
     """Tests for install_dependencies."""
 
-    def test_no_manager(self, temp_dir):
+    def test_no_manager(self, tmp_path):
         """Returns error if no package manager."""
         with patch.object(environment, "detect_package_manager", return_value=None):
-            result = environment.install_dependencies(temp_dir)
+            result = environment.install_dependencies(tmp_path)
         assert "error" in result
 
-    def test_no_project_files(self, temp_dir):
+    def test_no_project_files(self, tmp_path):
         """Returns error if no pyproject.toml or requirements.txt."""
         with patch.object(environment, "detect_package_manager", return_value="uv"):
-            result = environment.install_dependencies(temp_dir)
+            result = environment.install_dependencies(tmp_path)
         assert "error" in result
         assert "No pyproject.toml" in result["error"]
 
-    def test_install_with_pyproject(self, temp_dir):
+    def test_install_with_pyproject(self, tmp_path):
         """Installs with pyproject.toml."""
-        (temp_dir / "pyproject.toml").write_text("[project]")
+        (tmp_path / "pyproject.toml").write_text("[project]")
 
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
-            result = environment.install_dependencies(temp_dir)
+            result = environment.install_dependencies(tmp_path)
 
         assert result["status"] == "installed"
         cmd = mock_run.call_args[0][0]
         assert "uv" in cmd
         assert "sync" in cmd
 
-    def test_install_with_requirements(self, temp_dir):
+    def test_install_with_requirements(self, tmp_path):
         """Installs with requirements.txt."""
-        (temp_dir / "requirements.txt").write_text("requests")
+        (tmp_path / "requirements.txt").write_text("requests")
 
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
-            result = environment.install_dependencies(temp_dir)
+            result = environment.install_dependencies(tmp_path)
 
         assert result["status"] == "installed"
         cmd = mock_run.call_args[0][0]
         assert "requirements.txt" in cmd
 
-    def test_install_failure(self, temp_dir):
+    def test_install_failure(self, tmp_path):
         """Handles installation failure."""
-        (temp_dir / "requirements.txt").write_text("requests")
+        (tmp_path / "requirements.txt").write_text("requests")
 
         with patch.object(environment, "detect_package_manager", return_value="uv"), \
              patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=1, stderr="Error")
-            result = environment.install_dependencies(temp_dir)
+            result = environment.install_dependencies(tmp_path)
 
         assert "error" in result
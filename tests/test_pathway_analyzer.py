@@ -1,15 +1,23 @@
 """Tests for Parakeet pathway analyzer tools."""
 
-from unittest.mock import patch, MagicMock
+import os
+import threading
+import time
+from types import SimpleNamespace
 
 import pytest
+import requests
 
 from parakeet.core.tools import (
     analyze_pathway_tool,
     compare_organisms_tool,
     find_alternatives_tool,
 )
+from parakeet.core import pathway_analyzer
 from parakeet.core.pathway_analyzer import (
+    compare_pathway_organisms,
+    get_enzyme_info,
+    get_pathway_info,
     parse_kegg_flat_file,
     _process_section,
     _get_pathway_genes,
@@ -18,6 +26,54 @@ from parakeet.core.pathway_analyzer import (
 )
 
 
+@pytest.fixture(autouse=True)
+def kegg_cache_dir(tmp_path, monkeypatch):
+    """Point the KEGG disk cache at a per-test directory."""
+    cache_dir = tmp_path / "kegg_cache"
+    monkeypatch.setattr(pathway_analyzer, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def _clear_organism_names():
+    """Drop the memoized KEGG organism list between tests."""
+    pathway_analyzer._get_organism_names.cache_clear()
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Stub out KEGG GET requests.
+
+    Put response bodies (or exceptions to raise) in ``mock_get.bodies``;
+    each request takes the next one and the last is reused once they run
+    out. Bodies in ``mock_get.routes`` are served to any URL containing
+    their key instead, for requests made concurrently. A callable body is
+    called to produce the text. Requested URLs are recorded in
+    ``mock_get.urls``.
+    """
+    stub = SimpleNamespace(bodies=[], routes={}, urls=[])
+
+    def _fake_get(url, **kwargs):
+        stub.urls.append(url)
+        routed = [body for key, body in stub.routes.items() if key in url]
+        if routed:
+            body = routed[0]
+        else:
+            body = stub.bodies.pop(0) if len(stub.bodies) > 1 else stub.bodies[0]
+        if callable(body):
+            body = body()
+        if isinstance(body, BaseException):
+            raise body
+        return SimpleNamespace(text=body, raise_for_status=lambda: None)
+
+    monkeypatch.setattr(pathway_analyzer._SESSION, "get", _fake_get)
+    yield stub
+    # Let abandoned organism list downloads finish before the stub goes away
+    for thread in threading.enumerate():
+        if thread.name.startswith("kegg-names"):
+            thread.join()
+
+
 class TestParseKeggFlatFile:
     """Tests for KEGG flat file parser."""
 
@@ -65,46 +121,39 @@ ENZYME  1.18.6.1"""
         assert "multiple lines" in result["description"]
         assert "1.18.6.1" in result["enzymes"]
 
+    def test_parse_ignores_blank_lines_and_terminator(self):
+        """Skips blank lines and does not attach text after /// to a section."""
+        content = "NAME    Nitrogen metabolism\n\nMODULE  M00175\n///\n            stray"
+        result = parse_kegg_flat_file(content)
+        assert result["name"] == "Nitrogen metabolism"
+        assert result["modules"] == ["M00175"]
+
 
 class TestAnalyzePathwayTool:
     """Tests for analyze_pathway_tool."""
 
-    def test_info_analysis(self):
+    def test_info_analysis(self, mock_get):
         """Tests pathway info analysis."""
-        mock_response = MagicMock()
-        mock_response.text = "NAME    Nitrogen metabolism\nENZYME  1.18.6.1"
-        mock_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("NAME    Nitrogen metabolism\nENZYME  1.18.6.1")
 
-        with patch("requests.get", return_value=mock_response):
-            result = analyze_pathway_tool("map00910", analysis_type="info")
+        result = analyze_pathway_tool("map00910", analysis_type="info")
 
         assert result["name"] == "Nitrogen metabolism"
         assert "1.18.6.1" in result["enzymes"]
 
-    def test_enzymes_analysis(self):
+    def test_enzymes_analysis(self, mock_get):
         """Tests pathway enzymes analysis."""
-        mock_link_response = MagicMock()
-        mock_link_response.text = "map00910\tec:1.18.6.1\nmap00910\tec:6.3.1.2"
-        mock_link_response.raise_for_status = MagicMock()
-
-        mock_enzyme_response = MagicMock()
-        mock_enzyme_response.text = "NAME    Nitrogenase"
-        mock_enzyme_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("map00910\tec:1.18.6.1\nmap00910\tec:6.3.1.2")
 
-        with patch("requests.get") as mock_get:
-            mock_get.return_value = mock_link_response
-            result = analyze_pathway_tool("map00910", analysis_type="enzymes")
+        result = analyze_pathway_tool("map00910", analysis_type="enzymes")
 
         assert "enzyme_count" in result
 
-    def test_nitrogen_analysis(self):
+    def test_nitrogen_analysis(self, mock_get):
         """Tests specialized nitrogen fixation analysis."""
-        mock_response = MagicMock()
-        mock_response.text = "NAME    Nitrogen metabolism"
-        mock_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
 
-        with patch("requests.get", return_value=mock_response):
-            result = analyze_pathway_tool("00910", analysis_type="nitrogen")
+        result = analyze_pathway_tool("00910", analysis_type="nitrogen")
 
         assert result["organism"] == "avn"
 
@@ -123,24 +172,23 @@ class TestAnalyzePathwayTool:
 class TestCompareOrganismsTool:
     """Tests for compare_organisms_tool."""
 
-    def test_compare_two_organisms(self):
+    def test_compare_two_organisms(self, mock_get):
         """Tests comparing pathways between two organisms."""
-        mock_response = MagicMock()
-        mock_response.text = "eco00910\teco:b0001\neco00910\tko:K00001"
-        mock_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("eco00910\teco:b0001\neco00910\tko:K00001")
 
-        with patch("requests.get", return_value=mock_response):
-            result = compare_organisms_tool("00910", "eco", "avn")
+        result = compare_organisms_tool("00910", "eco", "avn")
 
         assert result["pathway"] == "00910"
         assert result["organism1"]["code"] == "eco"
         assert result["organism2"]["code"] == "avn"
         assert "comparison" in result
 
-    def test_compare_handles_api_error_gracefully(self):
+    def test_compare_handles_api_error_gracefully(self, mock_get):
         """Returns empty comparison when API fails (graceful degradation)."""
-        with patch("requests.get", side_effect=Exception("Connection error")):
-            result = compare_organisms_tool("00910", "eco", "avn")
+        mock_get.bodies.append(Exception("Connection error"))
+
+        result = compare_organisms_tool("00910", "eco", "avn")
+
         # Function returns empty results instead of error
         assert result["organism1"]["gene_count"] == 0
         assert result["organism2"]["gene_count"] == 0
@@ -150,114 +198,226 @@ class TestCompareOrganismsTool:
 class TestFindAlternativesTool:
     """Tests for find_alternatives_tool."""
 
-    def test_find_alternatives(self):
+    def test_find_alternatives(self, mock_get):
         """Tests finding alternative enzymes."""
-        mock_response = MagicMock()
-        mock_response.text = "ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_org_response = MagicMock()
-        mock_org_response.text = "genome\tavn\tAzotobacter vinelandii"
+        mock_get.bodies.append("ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002")
+        mock_get.routes["/list/organism"] = "genome\tavn\tAzotobacter vinelandii"
 
-        with patch("requests.get") as mock_get:
-            mock_get.side_effect = [mock_response, mock_org_response, mock_org_response]
-            result = find_alternatives_tool("1.18.6.1")
+        result = find_alternatives_tool("1.18.6.1")
 
         assert result["ec_number"] == "1.18.6.1"
-        assert "alternatives" in result
+        names = {alt["organism_code"]: alt["organism_name"] for alt in result["alternatives"]}
+        assert names == {"avn": "Azotobacter vinelandii", "eco": "eco"}
 
-    def test_find_alternatives_with_source_organism(self):
+    def test_find_alternatives_with_source_organism(self, mock_get):
         """Tests excluding source organism from results."""
-        mock_response = MagicMock()
-        mock_response.text = "ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002"
-        mock_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002")
+        mock_get.routes["/list/organism"] = "genome\teco\tEscherichia coli"
 
-        mock_org_response = MagicMock()
-        mock_org_response.text = "genome\teco\tEscherichia coli"
-
-        with patch("requests.get") as mock_get:
-            mock_get.side_effect = [mock_response, mock_org_response]
-            result = find_alternatives_tool("1.18.6.1", source_organism="avn")
+        result = find_alternatives_tool("1.18.6.1", source_organism="avn")
 
         assert result["ec_number"] == "1.18.6.1"
 
-    def test_find_alternatives_with_target_organisms(self):
+    def test_find_alternatives_with_target_organisms(self, mock_get):
         """Tests filtering by target organisms."""
-        mock_response = MagicMock()
-        mock_response.text = "ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002"
-        mock_response.raise_for_status = MagicMock()
+        mock_get.bodies.append("ec:1.18.6.1\tavn:Avin0001\nec:1.18.6.1\teco:b0002")
+        mock_get.routes["/list/organism"] = ""
 
-        with patch("requests.get", return_value=mock_response):
-            result = find_alternatives_tool("1.18.6.1", target_organisms="eco,bsu")
+        result = find_alternatives_tool("1.18.6.1", target_organisms="eco,bsu")
 
         assert result["ec_number"] == "1.18.6.1"
 
-    def test_find_alternatives_handles_api_error(self):
+    def test_find_alternatives_handles_api_error(self, mock_get):
         """Handles API errors gracefully."""
-        with patch("requests.get", side_effect=Exception("Connection error")):
-            result = find_alternatives_tool("1.18.6.1")
+        mock_get.bodies.append(Exception("Connection error"))
+
+        result = find_alternatives_tool("1.18.6.1")
+
+        assert "error" in result
+
+    def test_api_error_does_not_wait_for_organism_list(self, mock_get):
+        """Returns the error without waiting on the organism list download."""
+        release = threading.Event()
+        mock_get.routes["/list/organism"] = lambda: release.wait(5) and ""
+        mock_get.bodies.append(Exception("Connection error"))
+
+        start = time.monotonic()
+        result = find_alternatives_tool("1.18.6.1")
+        elapsed = time.monotonic() - start
+        release.set()
+
         assert "error" in result
+        assert elapsed < 1
 
 
 class TestHelperFunctions:
     """Tests for internal helper functions."""
 
-    def test_get_pathway_genes(self):
+    def test_get_pathway_genes(self, mock_get):
         """Tests getting genes for a pathway."""
-        mock_response = MagicMock()
-        mock_response.text = "eco00910\teco:b0001\neco00910\teco:b0002"
+        mock_get.bodies.append("eco00910\teco:b0001\neco00910\teco:b0002")
 
-        with patch("requests.get", return_value=mock_response):
-            genes = _get_pathway_genes("eco00910")
+        genes = _get_pathway_genes("eco00910")
 
         assert len(genes) == 2
         assert "eco:b0001" in genes
 
-    def test_get_pathway_genes_handles_error(self):
+    def test_get_pathway_genes_handles_error(self, mock_get):
         """Returns empty list on error."""
-        with patch("requests.get", side_effect=Exception("Error")):
-            genes = _get_pathway_genes("eco00910")
+        mock_get.bodies.append(Exception("Error"))
+
+        genes = _get_pathway_genes("eco00910")
+
         assert genes == []
 
-    def test_get_pathway_ko(self):
+    def test_get_pathway_ko(self, mock_get):
         """Tests getting KO assignments for a pathway."""
-        mock_response = MagicMock()
-        mock_response.text = "eco:b0001\tko:K00001\neco:b0002\tko:K00001"
+        mock_get.bodies.append("eco:b0001\tko:K00001\neco:b0002\tko:K00001")
 
-        with patch("requests.get", return_value=mock_response):
-            ko_map = _get_pathway_ko("eco00910")
+        ko_map = _get_pathway_ko("eco00910")
 
         assert "K00001" in ko_map
         assert len(ko_map["K00001"]) == 2
 
-    def test_get_pathway_ko_handles_error(self):
+    def test_get_pathway_ko_handles_error(self, mock_get):
         """Returns empty dict on error."""
-        with patch("requests.get", side_effect=Exception("Error")):
-            ko_map = _get_pathway_ko("eco00910")
+        mock_get.bodies.append(Exception("Error"))
+
+        ko_map = _get_pathway_ko("eco00910")
+
         assert ko_map == {}
 
-    def test_get_organism_name(self):
+    def test_get_enzyme_info_without_organism_links(self, mock_get):
+        """An HTTP error on the organism links keeps the enzyme details."""
+        mock_get.routes["/get/ec:"] = "NAME    Nitrogenase"
+        mock_get.routes["/link/genes/ec:"] = requests.HTTPError("404 Client Error")
+
+        info = get_enzyme_info("1.18.6.1")
+
+        assert "error" not in info
+        assert info["name"] == "Nitrogenase"
+        assert info["organisms"] == {}
+        assert info["organism_count"] == 0
+
+    def test_get_organism_name(self, mock_get):
         """Tests getting organism name from code."""
-        mock_response = MagicMock()
-        mock_response.text = "genome\teco\tEscherichia coli K-12 MG1655\tProkaryotes"
+        mock_get.bodies.append("genome\teco\tEscherichia coli K-12 MG1655\tProkaryotes")
 
-        with patch("requests.get", return_value=mock_response):
-            name = _get_organism_name("eco")
+        name = _get_organism_name("eco")
 
         assert name == "Escherichia coli K-12 MG1655"
 
-    def test_get_organism_name_not_found(self):
+    def test_get_organism_name_not_found(self, mock_get):
         """Returns code if organism not found."""
-        mock_response = MagicMock()
-        mock_response.text = ""
+        mock_get.bodies.append("")
 
-        with patch("requests.get", return_value=mock_response):
-            name = _get_organism_name("unknown")
+        name = _get_organism_name("unknown")
 
         assert name == "unknown"
 
-    def test_get_organism_name_handles_error(self):
+    def test_get_organism_name_handles_error(self, mock_get):
         """Returns code on error."""
-        with patch("requests.get", side_effect=Exception("Error")):
-            name = _get_organism_name("eco")
+        mock_get.bodies.append(Exception("Error"))
+
+        name = _get_organism_name("eco")
+
         assert name == "eco"
+
+    def test_get_organism_name_fetches_list_once(self, mock_get):
+        """Reuses the organism list across lookups."""
+        mock_get.bodies.append("T00007\teco\tEscherichia coli\nT00123\tavn\tAzotobacter vinelandii")
+
+        assert _get_organism_name("eco") == "Escherichia coli"
+        assert _get_organism_name("avn") == "Azotobacter vinelandii"
+        assert len(mock_get.urls) == 1
+
+
+class TestDiskCache:
+    """Tests for the on-disk KEGG response cache."""
+
+    def test_second_call_served_from_cache(self, mock_get, kegg_cache_dir):
+        """Repeated lookups hit the disk cache instead of the network."""
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
+
+        first = get_pathway_info("map00910")
+        second = get_pathway_info("map00910")
+
+        assert first == second
+        assert len(mock_get.urls) == 1
+        assert len(list(kegg_cache_dir.iterdir())) == 1
+
+    def test_errors_not_cached(self, mock_get, kegg_cache_dir):
+        """Failed lookups are retried on the next call."""
+        mock_get.bodies.append(Exception("Connection error"))
+
+        get_pathway_info("map00910")
+        get_pathway_info("map00910")
+
+        assert len(mock_get.urls) == 2
+        assert not kegg_cache_dir.exists()
+
+    def test_outage_fallback_not_cached(self, mock_get, kegg_cache_dir):
+        """Empty results returned during an outage do not outlive it."""
+        mock_get.routes["/link/"] = Exception("Connection error")
+        degraded = compare_pathway_organisms("00910", "eco", "avn")
+
+        mock_get.routes["/link/"] = "eco00910\teco:b0001\neco00910\tko:K00001"
+        recovered = compare_pathway_organisms("00910", "eco", "avn")
+
+        assert degraded["organism1"]["gene_count"] == 0
+        assert recovered["organism1"]["gene_count"] == 2
+        assert len(mock_get.urls) == 8
+
+    def test_interrupted_write_leaves_no_entry(self, mock_get, kegg_cache_dir, monkeypatch):
+        """A write that fails before the rename leaves nothing behind."""
+        def _fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pathway_analyzer.os, "replace", _fail)
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
+
+        result = get_pathway_info("map00910")
+
+        assert result["name"] == "Nitrogen metabolism"
+        assert list(kegg_cache_dir.iterdir()) == []
+
+    def test_least_recently_used_entry_evicted(self, mock_get, kegg_cache_dir, monkeypatch):
+        """Beyond CACHE_MAX_ENTRIES, the entry read least recently is dropped."""
+        monkeypatch.setattr(pathway_analyzer, "CACHE_MAX_ENTRIES", 2)
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
+
+        get_pathway_info("map00910")
+        get_pathway_info("map00920")
+        get_pathway_info("map00910")  # cache hit, now the most recent
+        get_pathway_info("map00930")
+        get_pathway_info("map00910")
+        get_pathway_info("map00920")
+
+        assert [url.rsplit("/", 1)[1] for url in mock_get.urls] == [
+            "map00910", "map00920", "map00930", "map00920",
+        ]
+        assert len(list(kegg_cache_dir.iterdir())) == 2
+
+    def test_expired_entries_pruned(self, mock_get, kegg_cache_dir):
+        """Writing a new entry removes entries past their TTL."""
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
+        get_pathway_info("map00910")
+        (stale,) = kegg_cache_dir.iterdir()
+        expired = time.time() - pathway_analyzer.CACHE_TTL - 1
+        os.utime(stale, (expired, expired))
+
+        get_pathway_info("map00920")
+
+        assert not stale.exists()
+        assert len(list(kegg_cache_dir.iterdir())) == 1
+
+    def test_cache_disabled(self, mock_get, kegg_cache_dir, monkeypatch):
+        """Bypasses the cache when disabled."""
+        monkeypatch.setattr(pathway_analyzer, "_cache_enabled", False)
+        mock_get.bodies.append("NAME    Nitrogen metabolism")
+
+        get_pathway_info("map00910")
+        get_pathway_info("map00910")
+
+        assert len(mock_get.urls) == 2
+        assert not kegg_cache_dir.exists()
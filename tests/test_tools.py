@@ -1,6 +1,8 @@
 """Tests for Parakeet tools."""
 
+import json
 import os
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -15,74 +17,90 @@ from parakeet.core.tools import (
     run_python_tool,
     is_sqlite_write_query,
     resolve_abs_path,
+    encode_result,
+    _split_simple_command,
+    validate_tool_args,
     TOOLS,
     TOOL_REGISTRY,
+    TOOL_VALIDATORS,
     DANGEROUS_TOOLS,
     CONDITIONAL_TOOLS,
 )
 
 
+_HOME_STR = str(Path.home())
+
+# Set PARAKEET_SKIP_EXEC=1 to skip the subprocess-spawning tests while iterating
+skip_exec = pytest.mark.skipif(
+    os.getenv("PARAKEET_SKIP_EXEC") == "1",
+    reason="exec tests skipped (PARAKEET_SKIP_EXEC=1)",
+)
+
+
 class TestResolveAbsPath:
     """Tests for resolve_abs_path helper."""
 
-    def test_absolute_path_unchanged(self):
-        path = resolve_abs_path("/tmp/test")
-        assert path == Path("/tmp/test")
+    @pytest.mark.parametrize("raw,check", [
+        ("/tmp/test", lambda p: p == Path("/tmp/test")),
+        ("test.txt", lambda p: p.is_absolute() and p.name == "test.txt"),
+        ("~/test.txt", lambda p: p.is_absolute() and str(p).startswith(_HOME_STR)),
+    ], ids=["absolute_unchanged", "relative_resolved", "home_expansion"])
+    def test_resolve(self, raw, check):
+        assert check(resolve_abs_path(raw))
 
-    def test_relative_path_resolved(self):
-        path = resolve_abs_path("test.txt")
-        assert path.is_absolute()
-        assert path.name == "test.txt"
 
-    def test_home_expansion(self):
-        path = resolve_abs_path("~/test.txt")
-        assert path.is_absolute()
-        assert str(path).startswith(str(Path.home()))
+_UNICODE_CONTENT = "Héllo, 世界! 🎉"
+
+
+@pytest.fixture(scope="class")
+def read_files(tmp_path_factory, temp_file_fast):
+    """Write the read_file_tool inputs once per test class."""
+    root = tmp_path_factory.mktemp("read")
+    temp_file_fast(root, "test.txt", b"Hello, World!")
+    temp_file_fast(root, "unicode.txt", _UNICODE_CONTENT.encode("utf-8"))
+    return root
 
 
 class TestReadFileTool:
     """Tests for read_file_tool."""
 
-    def test_read_existing_file(self, temp_file):
-        file_path = temp_file("test.txt", "Hello, World!")
+    def test_read_existing_file(self, read_files):
+        file_path = read_files / "test.txt"
         result = read_file_tool(str(file_path))
         assert result["content"] == "Hello, World!"
         assert result["path"] == str(file_path)
 
-    def test_read_file_with_unicode(self, temp_file):
-        content = "Héllo, 世界! 🎉"
-        file_path = temp_file("unicode.txt", content)
-        result = read_file_tool(str(file_path))
-        assert result["content"] == content
+    def test_read_file_with_unicode(self, read_files):
+        result = read_file_tool(str(read_files / "unicode.txt"))
+        assert result["content"] == _UNICODE_CONTENT
 
-    def test_read_nonexistent_file(self, temp_dir):
+    def test_read_nonexistent_file(self, tmp_path):
         with pytest.raises(FileNotFoundError):
-            read_file_tool(str(temp_dir / "nonexistent.txt"))
+            read_file_tool(str(tmp_path / "nonexistent.txt"))
 
 
 class TestListFilesTool:
     """Tests for list_files_tool."""
 
-    def test_list_empty_directory(self, temp_dir):
-        result = list_files_tool(str(temp_dir))
+    def test_list_empty_directory(self, tmp_path):
+        result = list_files_tool(str(tmp_path))
         assert result["files"] == []
 
-    def test_list_directory_with_files(self, temp_file):
+    def test_list_directory_with_files(self, temp_file, tmp_path):
         temp_file("file1.txt", "content1")
         temp_file("file2.py", "content2")
-        temp_dir = temp_file("file1.txt", "").parent
 
-        result = list_files_tool(str(temp_dir))
+        result = list_files_tool(str(tmp_path))
         files = {f["filename"] for f in result["files"]}
         assert "file1.txt" in files
         assert "file2.py" in files
 
-    def test_list_directory_with_subdirs(self, temp_file, temp_dir):
+    def test_list_directory_with_subdirs(self, temp_file, tmp_path):
         temp_file("file.txt", "content")
-        subdir = temp_dir / "subdir"
+        subdir = tmp_path / "subdir"
         subdir.mkdir()
 
-        result = list_files_tool(str(temp_dir))
+        result = list_files_tool(str(tmp_path))
         items = {(f["filename"], f["type"]) for f in result["files"]}
         assert ("file.txt", "file") in items
         assert ("subdir", "dir") in items
@@ -91,15 +109,15 @@ class TestListFilesTool:
 class TestEditFileTool:
     """Tests for edit_file_tool."""
 
-    def test_create_new_file(self, temp_dir):
-        file_path = temp_dir / "new_file.txt"
+    def test_create_new_file(self, tmp_path):
+        file_path = tmp_path / "new_file.txt"
         result = edit_file_tool(str(file_path), "", "New content")
 
         assert result["action"] == "created_file"
         assert file_path.read_text() == "New content"
 
-    def test_create_file_in_nested_directory(self, temp_dir):
-        file_path = temp_dir / "nested" / "dir" / "file.txt"
+    def test_create_file_in_nested_directory(self, tmp_path):
+        file_path = tmp_path / "nested" / "dir" / "file.txt"
         result = edit_file_tool(str(file_path), "", "Nested content")
 
         assert result["action"] == "created_file"
@@ -127,86 +145,164 @@ class TestEditFileTool:
         assert file_path.read_text() == "bar foo foo"
 
 
+# Payload lengths around the 200-character match preview cut-off
+_LINE_LENGTHS = [0, 199, 200, 201, 10000]
+
+# Files for the read-only search tests, one subdirectory per scenario.
+# Contents are lists of chunks, written with a single writev each.
+_SEARCH_CORPUS = {
+    "finds/test.py": [b"def hello():\n    print('Hello')\n"],
+    "finds/other.py": [b"def world():\n    pass\n"],
+    "file_pattern/test.py": [b"# TODO: fix this\n"],
+    "file_pattern/test.txt": [b"# TODO: fix that\n"],
+    "nested/src/pkg/module.py": [b"# TODO: nested\n"],
+    "nested/node_modules/dep/index.py": [b"# TODO: vendored\n"],
+    "globstar/src/top.py": [b"# TODO: top\n"],
+    "globstar/src/a/mid.py": [b"# TODO: mid\n"],
+    "globstar/src/a/b/deep.py": [b"# TODO: deep\n"],
+    "globstar/other/top.py": [b"# TODO: other\n"],
+    "case/test.txt": [b"Hello World\n"],
+    **{f"long/{n}/test.txt": [b"pattern ", b"x" * n, b"\n"] for n in _LINE_LENGTHS},
+}
+
+
+def _bulk_write(dir_fd: int, entries: dict[str, list[bytes]]) -> None:
+    """Create each file relative to an open directory fd with one writev."""
+    for rel_path, chunks in entries.items():
+        fd = os.open(rel_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600, dir_fd=dir_fd)
+        try:
+            os.writev(fd, chunks)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def search_corpus(tmp_path_factory):
+    """Build the search test tree once for the whole module."""
+    root = tmp_path_factory.mktemp("search")
+    for subdir in {os.path.dirname(rel_path) for rel_path in _SEARCH_CORPUS}:
+        os.makedirs(root / subdir, exist_ok=True)
+    dir_fd = os.open(root, os.O_RDONLY)
+    try:
+        _bulk_write(dir_fd, _SEARCH_CORPUS)
+    finally:
+        os.close(dir_fd)
+    return root
+
+
+def _matches(result):
+    """Matches from a search_code_tool result (empty on error)."""
+    return result.get("matches", [])
+
+
+def _only(result):
+    """The single match from a search_code_tool result."""
+    matches = _matches(result)
+    assert len(matches) == 1, matches
+    return matches[0]
+
+
 class TestSearchCodeTool:
     """Tests for search_code_tool."""
 
-    def test_search_finds_pattern(self, temp_file, temp_dir):
-        temp_file("test.py", "def hello():\n    print('Hello')\n")
-        temp_file("other.py", "def world():\n    pass\n")
-
-        result = search_code_tool("def hello", str(temp_dir))
+    def test_search_finds_pattern(self, search_corpus):
+        result = search_code_tool("def hello", str(search_corpus / "finds"))
 
         assert not result.get("error")
-        assert len(result["matches"]) == 1
-        assert result["matches"][0]["file"] == "test.py"
-        assert result["matches"][0]["line"] == 1
+        match = _only(result)
+        assert match["file"] == "test.py"
+        assert match["line"] == 1
 
-    def test_search_with_file_pattern(self, temp_file, temp_dir):
-        temp_file("test.py", "# TODO: fix this\n")
-        temp_file("test.txt", "# TODO: fix that\n")
+    def test_search_with_file_pattern(self, search_corpus):
+        result = search_code_tool("TODO", str(search_corpus / "file_pattern"), file_pattern="*.py")
 
-        result = search_code_tool("TODO", str(temp_dir), file_pattern="*.py")
+        assert _only(result)["file"] == "test.py"
 
-        assert len(result["matches"]) == 1
-        assert result["matches"][0]["file"] == "test.py"
+    def test_search_file_pattern_in_subdirectory(self, search_corpus):
+        result = search_code_tool("TODO", str(search_corpus / "nested"), file_pattern="*.py")
 
-    def test_search_case_insensitive(self, temp_file, temp_dir):
-        temp_file("test.txt", "Hello World\n")
+        assert _only(result)["file"] == str(Path("src/pkg/module.py"))
 
-        result = search_code_tool("hello", str(temp_dir))
+    @pytest.mark.parametrize("subdir, file_pattern, expected", [
+        ("file_pattern", "**/*.py", "test.py"),
+        ("nested", "**/*.py", "src/pkg/module.py"),
+        ("nested", "pkg/*.py", "src/pkg/module.py"),
+        ("nested", "src/**/*.py", "src/pkg/module.py"),
+        ("nested", "src/pkg/module.py", "src/pkg/module.py"),
+    ])
+    def test_search_file_pattern_with_path(self, search_corpus, subdir, file_pattern, expected):
+        result = search_code_tool("TODO", str(search_corpus / subdir), file_pattern=file_pattern)
 
-        assert len(result["matches"]) == 1
+        assert _only(result)["file"] == str(Path(expected))
 
-    def test_search_invalid_regex(self, temp_dir):
-        result = search_code_tool("[invalid(", str(temp_dir))
+    @pytest.mark.parametrize("file_pattern, expected", [
+        ("src/**/*.py", {"src/top.py", "src/a/mid.py", "src/a/b/deep.py"}),
+        ("**/*.py", {"src/top.py", "src/a/mid.py", "src/a/b/deep.py", "other/top.py"}),
+        ("a/**/*.py", {"src/a/mid.py", "src/a/b/deep.py"}),
+        ("b/*.py", {"src/a/b/deep.py"}),
+    ])
+    def test_search_file_pattern_globstar(self, search_corpus, file_pattern, expected):
+        result = search_code_tool("TODO", str(search_corpus / "globstar"), file_pattern=file_pattern)
+
+        assert {m["file"] for m in _matches(result)} == {str(Path(f)) for f in expected}
+
+    def test_search_file_pattern_path_mismatch(self, search_corpus):
+        result = search_code_tool("TODO", str(search_corpus / "nested"), file_pattern="src/*.py")
+
+        assert _matches(result) == []
+
+    def test_search_case_insensitive(self, search_corpus):
+        result = search_code_tool("hello", str(search_corpus / "case"))
+
+        _only(result)
+
+    def test_search_invalid_regex(self, tmp_path):
+        result = search_code_tool("[invalid(", str(tmp_path))
         assert "error" in result
         assert "Invalid regex" in result["error"]
 
-    def test_search_no_matches(self, temp_file, temp_dir):
+    def test_search_no_matches(self, temp_file, tmp_path):
         temp_file("test.txt", "Hello World\n")
 
-        result = search_code_tool("NotFound", str(temp_dir))
+        result = search_code_tool("NotFound", str(tmp_path))
 
         assert result["matches"] == []
         assert result["truncated"] is False
 
-    def test_search_ignores_git_directory(self, temp_file, temp_dir):
-        temp_file(".git/config", "pattern_to_find\n")
-        temp_file("src/main.py", "other content\n")
-
-        result = search_code_tool("pattern_to_find", str(temp_dir))
-
-        assert len(result["matches"]) == 0
+    def test_search_ignores_git_directory(self, sample_repo):
+        result = search_code_tool("pattern_to_find", str(sample_repo))
 
-    def test_search_truncates_long_lines(self, temp_file, temp_dir):
-        long_line = "x" * 300
-        temp_file("test.txt", f"pattern {long_line}\n")
+        assert not result.get("error")
+        assert _matches(result) == []
 
-        result = search_code_tool("pattern", str(temp_dir))
+    @pytest.mark.parametrize("n", _LINE_LENGTHS)
+    def test_truncates_at_boundary(self, search_corpus, n):
+        result = search_code_tool("pattern", str(search_corpus / "long" / str(n)))
 
-        assert len(result["matches"]) == 1
-        assert len(result["matches"][0]["content"]) <= 200
+        content = _only(result)["content"]
+        assert len(content) <= 200
+        assert content == ("pattern " + "x" * n).strip()[:200]
 
 
 class TestSqliteTool:
     """Tests for sqlite_tool."""
 
-    def test_select_query(self, temp_db):
-        result = sqlite_tool(str(temp_db), "SELECT * FROM users")
+    def test_select_query(self, readonly_db):
+        result = sqlite_tool(readonly_db, "SELECT * FROM users")
 
         assert "columns" in result
         assert result["columns"] == ["id", "name", "email"]
         assert result["row_count"] == 2
         assert result["rows"][0]["name"] == "Alice"
 
-    def test_select_with_where(self, temp_db):
-        result = sqlite_tool(str(temp_db), "SELECT name FROM users WHERE id = 1")
+    def test_select_with_where(self, readonly_db):
+        result = sqlite_tool(readonly_db, "SELECT name FROM users WHERE id = 1")
 
         assert result["row_count"] == 1
         assert result["rows"][0]["name"] == "Alice"
 
-    def test_pragma_table_info(self, temp_db):
-        result = sqlite_tool(str(temp_db), "PRAGMA table_info(users)")
+    def test_pragma_table_info(self, readonly_db):
+        result = sqlite_tool(readonly_db, "PRAGMA table_info(users)")
 
         assert "columns" in result
         columns = [row["name"] for row in result["rows"]]
@@ -214,9 +310,9 @@ class TestSqliteTool:
         assert "name" in columns
         assert "email" in columns
 
-    def test_parameterized_query(self, temp_db):
+    def test_parameterized_query(self, readonly_db):
         result = sqlite_tool(
-            str(temp_db),
+            readonly_db,
             "SELECT * FROM users WHERE name = ?",
             params=["Bob"]
         )
@@ -246,20 +342,20 @@ class TestSqliteTool:
 
         assert result["rows_affected"] == 1
 
-    def test_database_not_found(self, temp_dir):
-        result = sqlite_tool(str(temp_dir / "nonexistent.db"), "SELECT 1")
+    def test_database_not_found(self, tmp_path):
+        result = sqlite_tool(str(tmp_path / "nonexistent.db"), "SELECT 1")
 
         assert "error" in result
         assert "not found" in result["error"]
 
-    def test_invalid_sql(self, temp_db):
-        result = sqlite_tool(str(temp_db), "INVALID SQL QUERY")
+    def test_invalid_sql(self, readonly_db):
+        result = sqlite_tool(readonly_db, "INVALID SQL QUERY")
 
         assert "error" in result
         assert "SQLite error" in result["error"]
 
-    def test_table_not_found(self, temp_db):
-        result = sqlite_tool(str(temp_db), "SELECT * FROM nonexistent")
+    def test_table_not_found(self, readonly_db):
+        result = sqlite_tool(readonly_db, "SELECT * FROM nonexistent")
 
         assert "error" in result
 
@@ -267,30 +363,26 @@ class TestSqliteTool:
 class TestIsSqliteWriteQuery:
     """Tests for is_sqlite_write_query helper."""
 
-    @pytest.mark.parametrize("query", [
-        "SELECT * FROM users",
-        "  select name from users",
-        "PRAGMA table_info(users)",
-        "pragma database_list",
-    ])
-    def test_read_queries(self, query):
-        assert is_sqlite_write_query(query) is False
-
-    @pytest.mark.parametrize("query", [
-        "INSERT INTO users VALUES (1)",
-        "  insert into users values (1)",
-        "UPDATE users SET name = 'test'",
-        "DELETE FROM users WHERE id = 1",
-        "DROP TABLE users",
-        "CREATE TABLE test (id INT)",
-        "ALTER TABLE users ADD column",
-        "REPLACE INTO users VALUES (1)",
-        "TRUNCATE TABLE users",
+    @pytest.mark.parametrize("query,expected", [
+        ("SELECT * FROM users", False),
+        ("  select name from users", False),
+        ("PRAGMA table_info(users)", False),
+        ("pragma database_list", False),
+        ("INSERT INTO users VALUES (1)", True),
+        ("  insert into users values (1)", True),
+        ("UPDATE users SET name = 'test'", True),
+        ("DELETE FROM users WHERE id = 1", True),
+        ("DROP TABLE users", True),
+        ("CREATE TABLE test (id INT)", True),
+        ("ALTER TABLE users ADD column", True),
+        ("REPLACE INTO users VALUES (1)", True),
+        ("TRUNCATE TABLE users", True),
     ])
-    def test_write_queries(self, query):
-        assert is_sqlite_write_query(query) is True
+    def test_write_classification(self, query, expected):
+        assert is_sqlite_write_query(query) is expected
 
 
+@skip_exec
 class TestRunBashTool:
     """Tests for run_bash_tool."""
 
@@ -317,7 +409,54 @@ class TestRunBashTool:
         assert result["return_code"] == 0
         assert result["stdout"].strip() != ""
 
+    def test_shell_builtin(self):
+        result = run_bash_tool("cd /")
 
+        assert result["return_code"] == 0
+
+    def test_pipeline(self):
+        result = run_bash_tool("echo 'a b c' | wc -w")
+
+        assert result["stdout"].strip() == "3"
+
+    @pytest.mark.parametrize("command,uses_shell", [
+        ("echo 'Hello'", False),
+        ("echo -n 'test'", False),
+        ("echo $HOME", True),
+    ])
+    def test_shell_only_when_needed(self, monkeypatch, command, uses_shell):
+        real_run = subprocess.run
+        shells = []
+
+        def _spy(*args, **kwargs):
+            shells.append(kwargs.get("shell", False))
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", _spy)
+        run_bash_tool(command)
+
+        assert shells == [uses_shell]
+
+
+class TestSplitSimpleCommand:
+    """Tests for _split_simple_command helper."""
+
+    @pytest.mark.parametrize("command,expected", [
+        ("ls -la", ["ls", "-la"]),
+        ("echo 'Hello World'", ["echo", "Hello World"]),
+        ("git status", ["git", "status"]),
+        ("echo $HOME", None),
+        ("ls | wc -l", None),
+        ("ls *.py", None),
+        ("FOO=bar env", None),
+        ("echo 'unterminated", None),
+        ("", None),
+    ])
+    def test_split(self, command, expected):
+        assert _split_simple_command(command) == expected
+
+
+@skip_exec
 class TestRunPythonTool:
     """Tests for run_python_tool."""
 
@@ -359,21 +498,51 @@ print(f'Result: {result}')
         assert "SyntaxError" in result["stderr"]
 
 
+class TestEncodeResult:
+    """Tests for encode_result helper."""
+
+    def test_round_trips_through_json(self):
+        result = {"path": "/tmp/x", "content": "Héllo, 世界!", "rows": [{"id": 1}]}
+        encoded = encode_result(result)
+
+        assert isinstance(encoded, str)
+        assert json.loads(encoded) == result
+
+
+class TestValidateToolArgs:
+    """Tests for validate_tool_args helper."""
+
+    def test_valid_args(self):
+        assert validate_tool_args("read_file_tool", {"path": "test.py"}) is None
+
+    def test_optional_args_may_be_omitted(self):
+        assert validate_tool_args("search_code_tool", {"pattern": "TODO"}) is None
+
+    def test_missing_required_arg(self):
+        error = validate_tool_args("edit_file_tool", {"path": "test.py", "old_str": ""})
+        assert "Missing" in error
+        assert "new_str" in error
+
+    def test_unexpected_arg(self):
+        error = validate_tool_args("read_file_tool", {"path": "test.py", "encoding": "utf-8"})
+        assert "Unexpected" in error
+        assert "encoding" in error
+
+
 class TestToolRegistry:
     """Tests for tool registration."""
 
     def test_all_tools_registered(self):
-        for tool in TOOLS:
-            assert tool.__name__ in TOOL_REGISTRY
-            assert TOOL_REGISTRY[tool.__name__] == tool
+        assert {tool.__name__: tool for tool in TOOLS} == TOOL_REGISTRY
 
     def test_dangerous_tools_in_registry(self):
-        for tool_name in DANGEROUS_TOOLS:
-            assert tool_name in TOOL_REGISTRY
+        assert set(DANGEROUS_TOOLS) <= TOOL_REGISTRY.keys()
 
     def test_conditional_tools_in_registry(self):
-        for tool_name in CONDITIONAL_TOOLS:
-            assert tool_name in TOOL_REGISTRY
+        assert set(CONDITIONAL_TOOLS) <= TOOL_REGISTRY.keys()
+
+    def test_validators_cover_registry(self):
+        assert TOOL_VALIDATORS.keys() == TOOL_REGISTRY.keys()
 
     def test_tool_count(self):
         assert len(TOOLS) == len(TOOL_REGISTRY)